@@ -0,0 +1,16 @@
+"""Repo-wide pytest options.
+
+pytest only honours pytest_addoption in conftest files it loads at startup.
+pytest.ini pins rootdir here, so this file is loaded from any working
+directory. The integration marker is declared in pytest.ini.
+"""
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--integration",
+        action="store_true",
+        default=False,
+        help="run tests marked 'integration' (may call the real Sports API)",
+    )
+
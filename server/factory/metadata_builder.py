@@ -49,7 +49,7 @@ def text_tool_meta(tool: ToolDefinition) -> Dict[str, Any]:
 def embedded_widget_resource(cfg: Config, widget: Widget) -> types.EmbeddedResource:
     """Create an embedded widget resource containing the HTML.
 
-    HTML is loaded fresh from disk each time to support hot reload without server restart.
+    HTML is re-read from disk whenever the file changes to support hot reload without server restart.
 
     Args:
         cfg: Server configuration
@@ -60,7 +60,7 @@ def embedded_widget_resource(cfg: Config, widget: Widget) -> types.EmbeddedResou
     """
     from server.services.asset_loader import load_widget_html
 
-    # Load HTML fresh from disk (supports hot reload)
+    # Load HTML (re-read from disk when the file changes; supports hot reload)
     html = load_widget_html(widget.identifier, str(cfg.assets_dir))
 
     return types.EmbeddedResource(
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import inspect
 import logging
+from contextlib import asynccontextmanager
 from typing import Any, Dict, List
 
 import mcp.types as types
@@ -18,11 +19,8 @@ from server.models import (
     GetGamesBySportInput,
     GetGameDetailsInput,
 )
-from server.services import (
-    build_tools,
-    index_tools,
-    index_widgets_by_uri,
-)
+from server.services import build_tool_registry
+from server.services.sports import SportsClientFactory
 from server.handlers import (
     get_games_by_sport_handler,
     get_game_details_handler,
@@ -66,13 +64,11 @@ def create_mcp_server(cfg: Config) -> FastMCP:
     wrapper = SafeFastMCPWrapper(mcp)
 
     # Build tools and create indices
-    tools = build_tools(
+    tools, tools_by_name, widgets_by_uri = build_tool_registry(
         cfg,
         get_games_by_sport_handler=get_games_by_sport_handler,
         get_game_details_handler=get_game_details_handler,
     )
-    tools_by_name = index_tools(tools)
-    widgets_by_uri = index_widgets_by_uri(tools)
 
     logger.info(f"Registered {len(tools)} tools")
 
@@ -152,7 +148,7 @@ def create_mcp_server(cfg: Config) -> FastMCP:
                 tool_meta = widget_tool_meta(tool)
                 break
 
-        # Load HTML fresh from disk (supports hot reload)
+        # Load HTML (re-read from disk when the file changes; supports hot reload)
         from server.services.asset_loader import load_widget_html
         html = load_widget_html(widget.identifier, str(cfg.assets_dir))
 
@@ -405,6 +401,22 @@ def create_app(cfg: Config):
     mcp = create_mcp_server(cfg)
     app = mcp.streamable_http_app()
 
+    # Release pooled Sports API connections on shutdown. This wraps the
+    # app lifespan (session manager); FastMCP's own lifespan runs per
+    # request in stateless mode.
+    session_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(starlette_app):
+        try:
+            async with session_lifespan(starlette_app):
+                yield
+        finally:
+            await SportsClientFactory.aclose_all()
+            logger.info("Sports API HTTP clients closed")
+
+    app.router.lifespan_context = lifespan
+
     # Add health check endpoint
     from starlette.routing import Route
     from starlette.responses import JSONResponse
@@ -7,7 +7,7 @@ from typing import Any, Awaitable, Callable, Dict, Optional, Union
 from server.models.widget import Widget
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolDefinition:
     """MCP 툴 정의."""
     name: str
@@ -1,12 +1,20 @@
 """Services layer export."""
 from server.services.asset_loader import load_widget_html
-from server.services.widget_registry import build_widgets
-from server.services.tool_registry import build_tools, index_tools, index_widgets_by_uri
+from server.services.widget_registry import build_widgets, clear_widgets_cache, index_widgets
+from server.services.tool_registry import (
+    ToolRegistry,
+    build_tools,
+    build_tool_registry,
+    clear_tools_cache,
+)
 
 __all__ = [
     "load_widget_html",
     "build_widgets",
+    "clear_widgets_cache",
+    "index_widgets",
+    "ToolRegistry",
     "build_tools",
-    "index_tools",
-    "index_widgets_by_uri",
+    "build_tool_registry",
+    "clear_tools_cache",
 ]
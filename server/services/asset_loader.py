@@ -1,13 +1,22 @@
 """위젯 HTML 자산 로딩."""
 import logging
 from pathlib import Path
+from typing import Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
+# (component_name, assets_dir_str) -> ((st_mtime_ns, st_size), html)
+_html_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], str]] = {}
+
 
 def load_widget_html(component_name: str, assets_dir_str: str) -> str:
     """Load widget HTML from assets directory.
 
+    Content is cached per file and keyed on its modification time and
+    size, so a rebuilt asset is picked up on the next call (hot reload)
+    while unchanged files cost a single stat() instead of a full read.
+    Size catches rewrites that land within a coarse mtime tick.
+
     Args:
         component_name: Widget component name (e.g., 'example', 'game-result-viewer')
         assets_dir_str: Assets directory path as string
@@ -19,19 +28,30 @@ def load_widget_html(component_name: str, assets_dir_str: str) -> str:
         FileNotFoundError: If assets directory or widget HTML not found
     """
     assets_dir = Path(assets_dir_str)
-    if not assets_dir.exists():
-        raise FileNotFoundError(
-            f"Assets directory not found: {assets_dir}. "
-            "Run `npm run build` to generate the assets before starting the server."
-        )
-
     html_path = assets_dir / f"{component_name}.html"
-    if html_path.exists():
+    key = (component_name, assets_dir_str)
+
+    # Only stat the directory on failure, to build a precise error
+    try:
+        st = html_path.stat()
+        version = (st.st_mtime_ns, st.st_size)
+        cached = _html_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
         html = html_path.read_text(encoding="utf8")
-        logger.info(f"Loaded {html_path.name}")
-        return html
+    except FileNotFoundError:
+        _html_cache.pop(key, None)
+        if not assets_dir.exists():
+            raise FileNotFoundError(
+                f"Assets directory not found: {assets_dir}. "
+                "Run `npm run build` to generate the assets before starting the server."
+            ) from None
+        raise FileNotFoundError(
+            f"Widget HTML not found: {html_path}. "
+            "Run `npm run build` to generate widget assets."
+        ) from None
+
+    _html_cache[key] = (version, html)
+    logger.info("Loaded %s", html_path.name)
+    return html
 
-    raise FileNotFoundError(
-        f"Widget HTML not found: {html_path}. "
-        "Run `npm run build` to generate widget assets."
-    )
@@ -3,7 +3,8 @@
 게임 목록을 날짜+스포츠 키로 캐싱하여 중복 API 호출을 방지합니다.
 불완전한 데이터는 캐시하지 않습니다.
 """
-from typing import Any, Dict, List, Optional
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
 from cachetools import TTLCache
 import logging
@@ -12,31 +13,46 @@ from server.config import CONFIG
 
 logger = logging.getLogger(__name__)
 
-# 캐시 인스턴스 (CONFIG에서 설정값 로드)
-_game_list_cache: TTLCache = TTLCache(
-    maxsize=CONFIG.cache_max_size,
-    ttl=CONFIG.cache_ttl_seconds,
-)
+class _CacheEntry(NamedTuple):
+    """캐시 항목: 게임 목록과 game_id 인덱스."""
+
+    games: List[Dict[str, Any]]
+    index: Dict[Any, Dict[str, Any]]
+
+
+def _new_cache() -> TTLCache:
+    """CONFIG 설정값으로 빈 캐시 인스턴스 생성."""
+    return TTLCache(maxsize=CONFIG.cache_max_size, ttl=CONFIG.cache_ttl_seconds)
+
+
+# 프로세스 공용 캐시 인스턴스
+_game_list_cache: TTLCache = _new_cache()
+
+# 현재 컨텍스트의 캐시. 기본값은 공용 인스턴스이며,
+# 테스트는 set()으로 자기 컨텍스트에만 보이는 빈 캐시를 끼울 수 있습니다.
+_cache_ctx: ContextVar[TTLCache] = ContextVar("_cache_ctx", default=_game_list_cache)
 
 # 게임 데이터 필수 필드 (이 필드가 없으면 캐시하지 않음)
-REQUIRED_GAME_FIELDS = {"game_id", "home_team_name", "away_team_name"}
+REQUIRED_GAME_FIELDS = frozenset({"game_id", "home_team_name", "away_team_name"})
 
 
-def _make_key(date: str, sport: str) -> str:
+def _make_key(date: str, sport: str) -> Tuple[str, str]:
     """캐시 키 생성.
 
+    문자열을 이어붙이지 않고 튜플을 그대로 키로 사용합니다.
+
     Args:
         date: 날짜 (YYYYMMDD 형식)
         sport: 스포츠 종류 (basketball, soccer 등)
 
     Returns:
-        캐시 키 문자열 (예: "20241222_basketball")
+        캐시 키 튜플 (예: ("20241222", "basketball"))
     """
-    return f"{date}_{sport}"
+    return (date, sport)
 
 
-def _is_valid_game(game: Dict[str, Any]) -> bool:
-    """게임 데이터가 캐시할 만큼 유효한지 검증.
+def _is_valid_game_generic(game: Dict[str, Any]) -> bool:
+    """게임 데이터가 캐시할 만큼 유효한지 검증 (필드 순회 버전).
 
     Args:
         game: 게임 데이터 딕셔너리
@@ -46,29 +62,66 @@ def _is_valid_game(game: Dict[str, Any]) -> bool:
     """
     for field in REQUIRED_GAME_FIELDS:
         value = game.get(field)
-        if not value or (isinstance(value, str) and not value.strip()):
+        if not value or (isinstance(value, str) and value.isspace()):
             return False
     return True
 
 
-def _validate_games(games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """게임 목록에서 유효한 게임만 필터링.
+def _specialize_is_valid_game(fields: FrozenSet[str]) -> Callable[[Dict[str, Any]], bool]:
+    """필드 목록을 인라인으로 펼친 검증 함수를 생성.
+
+    필드가 고정되어 있으므로 루프 없이 필드마다 조건식 하나로 검사합니다.
+    동작은 _is_valid_game_generic과 동일합니다.
+
+    Args:
+        fields: 필수 필드 이름
+
+    Returns:
+        game -> bool 검증 함수
+    """
+    conditions = " and ".join(
+        f"(value := game.get({field!r})) and not (isinstance(value, str) and value.isspace())"
+        for field in sorted(fields)
+    )
+    source = f"def _is_valid_game(game):\n    return bool({conditions})\n"
+    namespace: Dict[str, Any] = {"__name__": __name__}
+    exec(compile(source, f"<generated {__name__}._is_valid_game>", "exec"), namespace)
+    validator = namespace["_is_valid_game"]
+    validator.__doc__ = _is_valid_game_generic.__doc__
+    return validator
+
+
+_is_valid_game = _specialize_is_valid_game(REQUIRED_GAME_FIELDS)
+
+
+def _validate_games(
+    games: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], Dict[Any, Dict[str, Any]]]:
+    """게임 목록에서 유효한 게임만 필터링하고 game_id 인덱스를 함께 생성 (1회 순회).
 
     Args:
         games: 게임 목록
 
     Returns:
-        유효한 게임만 포함된 목록
+        (유효한 게임 목록, game_id -> 게임 인덱스).
+        같은 game_id가 여러 번 나오면 인덱스는 첫 번째 게임을 유지
     """
-    valid_games = [g for g in games if _is_valid_game(g)]
+    valid_games: List[Dict[str, Any]] = []
+    index: Dict[Any, Dict[str, Any]] = {}
+    for game in games:
+        if _is_valid_game(game):
+            valid_games.append(game)
+            index.setdefault(game["game_id"], game)
 
     if len(valid_games) < len(games):
         invalid_count = len(games) - len(valid_games)
         logger.warning(
-            f"Filtered {invalid_count} invalid games (missing required fields: {REQUIRED_GAME_FIELDS})"
+            "Filtered %d invalid games (missing required fields: %s)",
+            invalid_count,
+            sorted(REQUIRED_GAME_FIELDS),
         )
 
-    return valid_games
+    return valid_games, index
 
 
 def cache_games(date: str, sport: str, games: List[Dict[str, Any]]) -> bool:
@@ -83,19 +136,18 @@ def cache_games(date: str, sport: str, games: List[Dict[str, Any]]) -> bool:
         캐시 저장 성공 여부 (유효한 게임이 1개 이상이면 True)
     """
     if not games:
-        logger.debug(f"Cache skip: empty games list for {date}_{sport}")
+        logger.debug("Cache skip: empty games list for %s_%s", date, sport)
         return False
 
-    # 유효한 게임만 필터링
-    valid_games = _validate_games(games)
+    # 유효한 게임 필터링 + 인덱스 생성
+    valid_games, index = _validate_games(games)
 
     if not valid_games:
-        logger.warning(f"Cache skip: no valid games for {date}_{sport}")
+        logger.warning("Cache skip: no valid games for %s_%s", date, sport)
         return False
 
-    key = _make_key(date, sport)
-    _game_list_cache[key] = valid_games
-    logger.debug(f"Cache store: key={key}, count={len(valid_games)}")
+    _cache_ctx.get()[_make_key(date, sport)] = _CacheEntry(valid_games, index)
+    logger.debug("Cache store: key=%s_%s, count=%d", date, sport, len(valid_games))
     return True
 
 
@@ -109,15 +161,14 @@ def get_cached_games(date: str, sport: str) -> Optional[List[Dict[str, Any]]]:
     Returns:
         캐시된 게임 목록 또는 None (캐시 미스)
     """
-    key = _make_key(date, sport)
-    games = _game_list_cache.get(key)
+    entry = _cache_ctx.get().get(_make_key(date, sport))
 
-    if games is not None:
-        logger.debug(f"Cache hit: key={key}, count={len(games)}")
-    else:
-        logger.debug(f"Cache miss: key={key}")
+    if entry is None:
+        logger.debug("Cache miss: key=%s_%s", date, sport)
+        return None
 
-    return games
+    logger.debug("Cache hit: key=%s_%s, count=%d", date, sport, len(entry.games))
+    return entry.games
 
 
 def invalidate_cache(date: str, sport: str) -> bool:
@@ -132,10 +183,8 @@ def invalidate_cache(date: str, sport: str) -> bool:
     Returns:
         삭제 성공 여부 (키가 존재했으면 True)
     """
-    key = _make_key(date, sport)
-    if key in _game_list_cache:
-        del _game_list_cache[key]
-        logger.debug(f"Cache invalidated: key={key}")
+    if _cache_ctx.get().pop(_make_key(date, sport), None) is not None:
+        logger.debug("Cache invalidated: key=%s_%s", date, sport)
         return True
     return False
 
@@ -155,13 +204,13 @@ def find_game_in_cache(
     Returns:
         게임 정보 딕셔너리 또는 None
     """
-    games = get_cached_games(date, sport)
-    if games:
-        for game in games:
-            if game.get("game_id") == game_id:
-                logger.debug(f"Cache find: game_id={game_id} found")
-                return game
-    return None
+    entry = _cache_ctx.get().get(_make_key(date, sport))
+    if entry is None:
+        return None
+    game = entry.index.get(game_id)
+    if game is not None:
+        logger.debug("Cache find: game_id=%s found", game_id)
+    return game
 
 
 def clear_cache() -> None:
@@ -169,7 +218,7 @@ def clear_cache() -> None:
 
     테스트 격리를 위해 사용합니다.
     """
-    _game_list_cache.clear()
+    _cache_ctx.get().clear()
     logger.debug("Cache cleared")
 
 
@@ -179,8 +228,9 @@ def get_cache_info() -> Dict[str, Any]:
     Returns:
         캐시 크기, 최대 크기, TTL 정보
     """
+    cache = _cache_ctx.get()
     return {
-        "current_size": len(_game_list_cache),
-        "max_size": _game_list_cache.maxsize,
-        "ttl": _game_list_cache.ttl,
+        "current_size": len(cache),
+        "max_size": cache.maxsize,
+        "ttl": cache.ttl,
     }
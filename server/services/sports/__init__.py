@@ -60,6 +60,12 @@ class SportsClientFactory:
         del cls._registry[sport]
         cls._instances.pop(sport, None)
 
+    @classmethod
+    async def aclose_all(cls) -> None:
+        """Close the pooled HTTP clients of every created client instance."""
+        for client in list(cls._instances.values()):
+            await client.aclose()
+
     @classmethod
     def list_sports(cls) -> list[str]:
         """List all registered sports.
@@ -87,13 +93,18 @@ class SportsClientFactory:
         Raises:
             ValueError: Unsupported sport
         """
-        if sport not in cls._registry:
+        # Fast path: already-created singleton (one dict lookup)
+        client = cls._instances.get(sport)
+        if client is not None:
+            return client
+
+        client_class = cls._registry.get(sport)
+        if client_class is None:
             available = ", ".join(sorted(cls._registry.keys()))
             raise ValueError(
                 f"Unsupported sport: {sport}. "
                 f"Available: {available}"
             )
 
-        if sport not in cls._instances:
-            cls._instances[sport] = cls._registry[sport]()
-        return cls._instances[sport]
+        client = cls._instances[sport] = client_class()
+        return client
@@ -1,8 +1,15 @@
 """Base Sports API Client with common HTTP request logic."""
-from typing import Dict, Any, Optional, List, TYPE_CHECKING
+from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
 from abc import ABC, abstractmethod
+import asyncio
 import logging
 import httpx
+from cachetools import LRUCache
+
+try:
+    import orjson
+except ImportError:  # optional (pip install orjson): faster JSON parsing
+    orjson = None
 
 from server.config import CONFIG
 from server.errors import APIError, APIErrorCode
@@ -12,6 +19,24 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Max (url, params) entries kept per client for ETag revalidation
+ETAG_CACHE_SIZE = 256
+
+# Keep-alive pool shared by all requests of one client
+# (max_connections stays at the httpx default of 100)
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=10)
+
+
+def _parse_json(response: httpx.Response) -> Any:
+    """Parse a JSON response body, with orjson when it can read it.
+
+    orjson only decodes UTF-8, so bodies declared in another charset go
+    through response.json(), which also handles UTF-16/32.
+    """
+    if orjson is not None and response.encoding.lower() in ("utf-8", "utf8"):
+        return orjson.loads(response.content)
+    return response.json()
+
 
 class BaseSportsClient(ABC):
     """Base class for Sports API clients.
@@ -26,6 +51,11 @@ class BaseSportsClient(ABC):
         self.base_url = CONFIG.sports_api_base_url
         self.api_key = CONFIG.sports_api_key
         self.timeout = CONFIG.sports_api_timeout_s
+        # (url, sorted params) -> (ETag, parsed JSON) for conditional GETs
+        self._etag_cache: LRUCache = LRUCache(maxsize=ETAG_CACHE_SIZE)
+        # Pooled HTTP client, created lazily on the loop that first uses it
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
         if self.use_mock:
             logger.info(f"{self.__class__.__name__} initialized with MOCK data")
@@ -59,9 +89,45 @@ class BaseSportsClient(ABC):
         """
         pass
 
+    async def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for the running event loop.
+
+        Connections are reused across requests (keep-alive). A pool is tied
+        to the loop it was opened on, so if the running loop changed (e.g. a
+        second asyncio.run()) the old client is closed and a new one created.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._http_client is None
+            or self._http_client.is_closed
+            or self._http_client_loop is not loop
+        ):
+            old = self._http_client
+            self._http_client = httpx.AsyncClient(timeout=self.timeout, limits=HTTP_LIMITS)
+            self._http_client_loop = loop
+            if old is not None and not old.is_closed:
+                try:
+                    await old.aclose()
+                except Exception as e:
+                    # Sockets of a finished loop may already be unusable
+                    logger.debug(f"Closing stale HTTP client failed: {type(e).__name__}: {e}")
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._http_client_loop = None
+
     async def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Any:
         """Make async HTTP request to the Sports API.
 
+        If the upstream sent an ETag for the same URL and params before,
+        the request carries If-None-Match. A 304 Not Modified reply then
+        returns the previously parsed body without re-parsing. The cached
+        body is shared, so callers must not mutate it.
+
         Args:
             endpoint: API endpoint path (e.g., "/data3V1/livescore/gameList")
             params: Request parameters
@@ -80,11 +146,22 @@ class BaseSportsClient(ABC):
 
         logger.debug(f"Making async request to {url} with params: {params}")
 
+        cache_key: Tuple[str, Tuple[Tuple[str, Any], ...]] = (url, tuple(sorted(params.items())))
+        cached = self._etag_cache.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params_with_key)
-                response.raise_for_status()
-                return response.json()
+            client = await self._get_http_client()
+            response = await client.get(url, params=params_with_key, headers=headers)
+            if cached and response.status_code == 304:
+                logger.debug(f"Not modified (ETag hit): {url}")
+                return cached[1]
+            response.raise_for_status()
+            data = _parse_json(response)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etag_cache[cache_key] = (etag, data)
+            return data
 
         except httpx.TimeoutException as e:
             # Includes ConnectTimeout, ReadTimeout, WriteTimeout, PoolTimeout
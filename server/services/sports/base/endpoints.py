@@ -1,6 +1,8 @@
 """Common endpoint definitions shared across all sports."""
-from typing import Dict, Set
+from types import MappingProxyType
+from typing import Dict, Mapping, Set
 from dataclasses import dataclass, field
+from functools import cached_property
 
 from server.config import CONFIG
 
@@ -32,19 +34,28 @@ class CommonEndpoints:
 COMMON_ENDPOINTS = CommonEndpoints()
 
 
-@dataclass
+@dataclass(frozen=True)
 class SportEndpointConfig:
     """Configuration for sport-specific endpoints.
 
+    Immutable: the dataclass is frozen, and __post_init__ stores copies of
+    endpoints and use_common as a read-only mapping and a frozenset. The
+    resolved operation map can therefore be computed once and cached.
+
     Attributes:
         sport_name: The sport identifier (e.g., 'basketball', 'soccer')
-        endpoints: Dict mapping operation names to endpoint paths
-        use_common: Set of operation names that should use common endpoints
+        endpoints: Mapping of operation names to endpoint paths (read-only)
+        use_common: Operation names that should use common endpoints (frozenset)
     """
     sport_name: str
-    endpoints: Dict[str, str] = field(default_factory=dict)
+    endpoints: Mapping[str, str] = field(default_factory=dict)
     use_common: Set[str] = field(default_factory=lambda: {"games"})
 
+    def __post_init__(self):
+        # Snapshot the caller's containers so later mutation cannot reach us
+        object.__setattr__(self, "endpoints", MappingProxyType(dict(self.endpoints)))
+        object.__setattr__(self, "use_common", frozenset(self.use_common))
+
     def get_endpoint(self, operation: str) -> str:
         """Get endpoint for an operation.
 
@@ -78,12 +89,9 @@ class SportEndpointConfig:
             f"Available: {sorted(available)}"
         )
 
-    def list_operations(self) -> Dict[str, str]:
-        """List all available operations and their endpoints.
-
-        Returns:
-            Dict mapping operation names to endpoint paths (with [common] prefix for shared)
-        """
+    @cached_property
+    def _operations(self) -> Dict[str, str]:
+        """Resolved operation -> endpoint map, built on first access."""
         result = {}
 
         # Common endpoints
@@ -92,11 +100,20 @@ class SportEndpointConfig:
                 result[op] = f"[common] {getattr(COMMON_ENDPOINTS, op)}"
 
         # Sport-specific endpoints (may override common)
-        for op, endpoint in self.endpoints.items():
-            result[op] = endpoint
+        result.update(self.endpoints)
 
         return result
 
+    def list_operations(self) -> Dict[str, str]:
+        """List all available operations and their endpoints.
+
+        The returned dict is cached on the config; do not mutate it.
+
+        Returns:
+            Dict mapping operation names to endpoint paths (with [common] prefix for shared)
+        """
+        return self._operations
+
     def has_operation(self, operation: str) -> bool:
         """Check if an operation is supported.
 
@@ -106,8 +123,4 @@ class SportEndpointConfig:
         Returns:
             True if operation is available
         """
-        if operation in self.endpoints:
-            return True
-        if operation in self.use_common and hasattr(COMMON_ENDPOINTS, operation):
-            return True
-        return False
+        return operation in self._operations
@@ -3,6 +3,7 @@ from typing import Dict, List, Any, Optional
 import logging
 
 from server.services.sports.base.client import BaseSportsClient
+from server.services.sports.base.endpoints import SportEndpointConfig
 from server.services.sports.basketball.mapper import BasketballMapper
 from server.services.sports.basketball.endpoints import BASKETBALL_ENDPOINTS
 from server.services.sports.basketball.mock_data import (
@@ -44,19 +45,26 @@ class BasketballClient(BaseSportsClient):
         "3BK": "BNK썸", "3SH": "신한은행", "3WB": "우리은행",
     }
 
-    def __init__(self):
-        """Initialize basketball API client."""
+    def __init__(self, endpoint_config: Optional[SportEndpointConfig] = None):
+        """Initialize basketball API client.
+
+        Args:
+            endpoint_config: Endpoint mapping override (defaults to BASKETBALL_ENDPOINTS)
+        """
         super().__init__()
         self.mapper = BasketballMapper()
+        self._endpoint_config = (
+            endpoint_config if endpoint_config is not None else BASKETBALL_ENDPOINTS
+        )
 
     def get_sport_name(self) -> str:
         """Return the sport name."""
         return "basketball"
 
     @property
-    def endpoint_config(self):
+    def endpoint_config(self) -> SportEndpointConfig:
         """Return basketball endpoint configuration."""
-        return BASKETBALL_ENDPOINTS
+        return self._endpoint_config
 
     def get_league_id_map(self) -> Dict[str, str]:
         """Return basketball league name -> ID mapping from config file."""
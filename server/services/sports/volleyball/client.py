@@ -156,17 +156,21 @@ class VolleyballClient(BaseSportsClient):
         endpoint = self._get_endpoint_for_operation("player_stats")
         all_stats: List[Dict[str, Any]] = []
 
-        for team_id in [home_team_id, away_team_id]:
+        # Bind per-team loop callables once
+        make_request = self._make_request
+        map_player_stats_list = self.mapper.map_player_stats_list
+
+        for team_id in (home_team_id, away_team_id):
             if not team_id:
                 continue
             try:
-                response = await self._make_request(endpoint, {"game_id": game_id, "team_id": team_id})
+                response = await make_request(endpoint, {"game_id": game_id, "team_id": team_id})
                 if logger.isEnabledFor(logging.DEBUG):
                     raw_items = response.get("Data", {}).get("list", [])
                     if raw_items:
                         logger.debug(f"[DEBUG] volleyball player stat raw keys: {list(raw_items[0].keys())}")
                         logger.debug(f"[DEBUG] volleyball player stat first record: {raw_items[0]}")
-                team_stats = self.mapper.map_player_stats_list(response)
+                team_stats = map_player_stats_list(response)
                 all_stats.extend(team_stats)
                 logger.debug(f"[REAL API] {len(team_stats)} players for team {team_id}")
             except Exception as e:
@@ -1,6 +1,7 @@
 """툴 레지스트리."""
 import logging
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
 
 from server.config import Config
 from server.models import (
@@ -10,17 +11,58 @@ from server.models import (
     GET_GAMES_BY_SPORT_SCHEMA,
     GET_GAME_DETAILS_SCHEMA,
 )
-from server.services.widget_registry import build_widgets
+from server.services.widget_registry import build_widgets, index_widgets
 
 logger = logging.getLogger(__name__)
 
+# Tool descriptions ("%s" is filled with cfg.description_version)
+_GAMES_BY_SPORT_DESCRIPTION = (
+    "[v%s] Get list of games for a specific date. Returns game_id needed for get_game_details. "
+    "This is a TEXT-ONLY lookup tool - use ONLY to find game_id, NOT to display game info."
+    "\n\nCACHING: Results are cached for 5 minutes. Use force_refresh=true if data seems stale "
+    "or user reports incorrect information."
+    "\n\nIMPORTANT: To show game information to users (scores, stats, standings), "
+    "you MUST call get_game_details with the game_id from this tool's result."
+    "\n\nSupported sports: basketball, soccer, volleyball, baseball"
+    "\n\nCommon team aliases:"
+    "\n- Warriors, Goldens -> Golden State (NBA)"
+    "\n- Cavs -> Cleveland (NBA)"
+    "\n- Thunder -> Oklahoma City (NBA)"
+    "\n- Bluemings -> Yongin Samsung Life (WKBL)"
+    "\n- S-Birds -> Incheon Shinhan Bank (WKBL)"
+    "\n\nDo not expose the game_id to the user."
+    "\nShow the game list to the user in a table format."
+    "\nSelect one important match from the game list and call get_game_details to show it to the user with a widget."
+)
+
+_GAME_DETAILS_DESCRIPTION = (
+    "[v%s] REQUIRED for displaying ANY game information to users. Returns interactive widget with:"
+    "\n- Before game: matchup preview, team standings, head-to-head records"
+    "\n- During game: live scores, real-time stats, play-by-play"
+    "\n- After game: final scores, team/player stats, game records"
+    "\n\nALWAYS call this tool after get_games_by_sport to show game info. "
+    "Never respond with just text from get_games_by_sport - users expect the visual widget."
+    "\n\nUse get_games_by_sport first to get the game_id, then call this tool."
+)
+
+
+class ToolRegistry(NamedTuple):
+    """Tools plus the lookup indexes the server needs."""
+    tools: Tuple[ToolDefinition, ...]
+    tools_by_name: Dict[str, ToolDefinition]
+    widgets_by_uri: Dict[str, Widget]
+
+
+# Distinct (description_version, widgets, handlers) combinations kept built
+TOOLS_CACHE_SIZE = 8
+
 
 def build_tools(
     cfg: Config,
     get_games_by_sport_handler=None,
     get_game_details_handler=None,
-) -> List[ToolDefinition]:
-    """Build list of available tools (both widget-based and text-based).
+) -> Tuple[ToolDefinition, ...]:
+    """Build available tools (both widget-based and text-based).
 
     Args:
         cfg: Server configuration
@@ -28,99 +70,110 @@ def build_tools(
         get_game_details_handler: Game details (widget) handler function
 
     Returns:
-        List of ToolDefinition instances
-    """
-    widgets = build_widgets(cfg)
-    tools = []
-
-    # Find game-result-viewer widget for get_game_details
-    # Support both hashed and non-hashed identifiers
-    game_result_viewer_widget = None
-    for widget in widgets:
-        if widget.identifier == "game-result-viewer" or widget.identifier.startswith("game-result-viewer-"):
-            game_result_viewer_widget = widget
-            break
-
-    # Sports data tools
-    if get_games_by_sport_handler:
-        tools.append(
-            ToolDefinition(
-                name="get_games_by_sport",
-                title="Get Games by Sport",
-                description=(
-                    f"[v{cfg.description_version}] Get list of games for a specific date. Returns game_id needed for get_game_details. "
-                    "This is a TEXT-ONLY lookup tool - use ONLY to find game_id, NOT to display game info."
-                    "\n\nCACHING: Results are cached for 5 minutes. Use force_refresh=true if data seems stale "
-                    "or user reports incorrect information."
-                    "\n\nIMPORTANT: To show game information to users (scores, stats, standings), "
-                    "you MUST call get_game_details with the game_id from this tool's result."
-                    "\n\nSupported sports: basketball, soccer, volleyball, baseball"
-                    "\n\nCommon team aliases:"
-                    "\n- Warriors, Goldens -> Golden State (NBA)"
-                    "\n- Cavs -> Cleveland (NBA)"
-                    "\n- Thunder -> Oklahoma City (NBA)"
-                    "\n- Bluemings -> Yongin Samsung Life (WKBL)"
-                    "\n- S-Birds -> Incheon Shinhan Bank (WKBL)"
-                    "\n\nDo not expose the game_id to the user."
-                    "\nShow the game list to the user in a table format."
-                    "\nSelect one important match from the game list and call get_game_details to show it to the user with a widget."
-                ),
-                input_schema=GET_GAMES_BY_SPORT_SCHEMA,
-                handler=get_games_by_sport_handler,
-                invoking="Fetching game schedules...",
-                invoked="Game schedules retrieved",
-            )
-        )
-
-    # get_game_details: Widget-based tool with custom handler
-    if get_game_details_handler and game_result_viewer_widget:
-        tools.append(
-            ToolDefinition(
-                name="get_game_details",
-                title="Game Details",
-                description=(
-                    f"[v{cfg.description_version}] REQUIRED for displaying ANY game information to users. Returns interactive widget with:"
-                    "\n- Before game: matchup preview, team standings, head-to-head records"
-                    "\n- During game: live scores, real-time stats, play-by-play"
-                    "\n- After game: final scores, team/player stats, game records"
-                    "\n\nALWAYS call this tool after get_games_by_sport to show game info. "
-                    "Never respond with just text from get_games_by_sport - users expect the visual widget."
-                    "\n\nUse get_games_by_sport first to get the game_id, then call this tool."
-                ),
-                input_schema=GET_GAME_DETAILS_SCHEMA,
-                widget=game_result_viewer_widget,
-                handler=get_game_details_handler,
-                invoking="Loading game details...",
-                invoked="Game details loaded",
-            )
-        )
-
-    return tools
-
+        Tuple of ToolDefinition instances (immutable; shared across calls)
 
-def index_tools(tools: List[ToolDefinition]) -> Dict[str, ToolDefinition]:
-    """Create tool index by name.
-
-    Args:
-        tools: List of tools
-
-    Returns:
-        Dictionary mapping tool name to ToolDefinition
+    Note:
+        Results are cached on the inputs that shape the tool list
+        (cfg.description_version, the widget set and the handlers).
+        Call clear_tools_cache() to force a rebuild.
     """
-    return {t.name: t for t in tools}
-
-
-def index_widgets_by_uri(tools: List[ToolDefinition]) -> Dict[str, Widget]:
-    """Create widget index by URI (for resource reads).
+    return _build_tools_cached(
+        cfg.description_version,
+        tuple(build_widgets(cfg)),
+        get_games_by_sport_handler,
+        get_game_details_handler,
+    )
+
+
+def clear_tools_cache() -> None:
+    """Drop cached tool tuples so the next build_tools() rebuilds them."""
+    _build_tools_cached.cache_clear()
+
+
+@lru_cache(maxsize=TOOLS_CACHE_SIZE)
+def _build_tools_cached(
+    description_version: str,
+    widgets: Tuple[Widget, ...],
+    get_games_by_sport_handler,
+    get_game_details_handler,
+) -> Tuple[ToolDefinition, ...]:
+    """Construct the tool tuple (cached on its hashable inputs)."""
+    return tuple(
+        tool
+        for tool in (
+            _maybe_games_by_sport_tool(description_version, get_games_by_sport_handler),
+            _maybe_game_details_tool(description_version, widgets, get_game_details_handler),
+        )
+        if tool is not None
+    )
+
+
+def _maybe_games_by_sport_tool(description_version: str, handler) -> Optional[ToolDefinition]:
+    """get_games_by_sport: text tool, registered when a handler is given."""
+    if not handler:
+        return None
+    return ToolDefinition(
+        name="get_games_by_sport",
+        title="Get Games by Sport",
+        description=_GAMES_BY_SPORT_DESCRIPTION % description_version,
+        input_schema=GET_GAMES_BY_SPORT_SCHEMA,
+        handler=handler,
+        invoking="Fetching game schedules...",
+        invoked="Game schedules retrieved",
+    )
+
+
+def _maybe_game_details_tool(
+    description_version: str,
+    widgets: Tuple[Widget, ...],
+    handler,
+) -> Optional[ToolDefinition]:
+    """get_game_details: widget tool, needs a handler and the game-result-viewer widget."""
+    if not handler:
+        return None
+
+    # index_widgets also keys hashed identifiers by base name
+    widget = index_widgets(widgets).get("game-result-viewer")
+    if widget is None:
+        return None
+
+    return ToolDefinition(
+        name="get_game_details",
+        title="Game Details",
+        description=_GAME_DETAILS_DESCRIPTION % description_version,
+        input_schema=GET_GAME_DETAILS_SCHEMA,
+        widget=widget,
+        handler=handler,
+        invoking="Loading game details...",
+        invoked="Game details loaded",
+    )
+
+
+def build_tool_registry(
+    cfg: Config,
+    get_games_by_sport_handler=None,
+    get_game_details_handler=None,
+) -> ToolRegistry:
+    """Build tools and their name/URI indexes in a single pass.
 
     Args:
-        tools: List of tools
+        cfg: Server configuration
+        get_games_by_sport_handler: Sports game list handler function
+        get_game_details_handler: Game details (widget) handler function
 
     Returns:
-        Dictionary mapping widget URI to Widget
+        ToolRegistry with tools, tools_by_name and widgets_by_uri
     """
-    result = {}
+    tools = build_tools(
+        cfg,
+        get_games_by_sport_handler=get_games_by_sport_handler,
+        get_game_details_handler=get_game_details_handler,
+    )
+    tools_by_name = {}
+    widgets_by_uri = {}
     for tool in tools:
-        if tool.has_widget and tool.widget:
-            result[tool.widget.template_uri] = tool.widget
-    return result
+        tools_by_name[tool.name] = tool
+        if tool.has_widget:
+            widgets_by_uri[tool.widget.template_uri] = tool.widget
+    return ToolRegistry(tools, tools_by_name, widgets_by_uri)
+
@@ -1,20 +1,35 @@
 """위젯 레지스트리."""
 import logging
-from typing import List
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
 
 from server.config import Config
 from server.models import Widget
 
 logger = logging.getLogger(__name__)
 
+# Base widgets: (base name, title)
+WIDGET_DEFINITIONS: Tuple[Tuple[str, str], ...] = (
+    ("example", "Example Widget"),
+    ("game-result-viewer", "Game Result Viewer"),
+)
+
+# Content-hash suffix on built widget names (e.g. "game-result-viewer-1a2b3c4d")
+_HASH_SUFFIX_RE = re.compile(r"-[0-9a-f]{8,}$")
+
 
 def build_widgets(cfg: Config) -> List[Widget]:
     """Build list of available widgets.
 
-    Note: HTML is not loaded here anymore. It's loaded fresh from disk
-    each time via embedded_widget_resource() to support hot reload.
+    Note: HTML is not loaded here anymore. It's loaded via
+    embedded_widget_resource(), which re-reads the file whenever its
+    mtime changes to support hot reload.
 
     Using simple widget names without hashing for easier development.
+    The widget set does not depend on cfg, so it is built once and reused;
+    call clear_widgets_cache() to force a rebuild.
 
     Args:
         cfg: Server configuration
@@ -22,19 +37,20 @@ def build_widgets(cfg: Config) -> List[Widget]:
     Returns:
         List of Widget instances
     """
-    widgets = []
+    return list(_build_widgets_cached())
+
 
-    # Define base widgets with their names
-    widget_definitions = [
-        ("example", "Example Widget"),
-        ("game-result-viewer", "Game Result Viewer"),
-    ]
+@lru_cache(maxsize=1)
+def _build_widgets_cached() -> Tuple[Widget, ...]:
+    """Build the widget set once (Widget is frozen, so sharing is safe)."""
+    widgets = []
 
-    for base_name, title in widget_definitions:
-        # Use simple names without hashing
-        identifier = base_name
-        template_uri = f"ui://widget/{base_name}.html"
-        logger.info(f"Widget '{base_name}' registered")
+    for base_name, title in WIDGET_DEFINITIONS:
+        # Use simple names without hashing. Interned because both are used
+        # as dict keys on the request path (tool/resource lookups).
+        identifier = sys.intern(base_name)
+        template_uri = sys.intern(f"ui://widget/{base_name}.html")
+        logger.info("Widget '%s' registered", base_name)
 
         widgets.append(
             Widget(
@@ -44,4 +60,36 @@ def build_widgets(cfg: Config) -> List[Widget]:
             )
         )
 
-    return widgets
+    return tuple(widgets)
+
+
+def clear_widgets_cache() -> None:
+    """Drop the cached widget set so the next build_widgets() rebuilds it."""
+    _build_widgets_cached.cache_clear()
+
+
+def index_widgets(widgets: Iterable[Widget]) -> Dict[str, Widget]:
+    """Create widget index by identifier and base name.
+
+    Content-hashed identifiers are also indexed under their base name
+    (hash suffix stripped), so callers can always look up by base name.
+    Exact identifiers take priority over stripped base names. Any
+    identifier ending in "-" plus 8+ hex chars is treated as hashed, so
+    avoid such suffixes (e.g. dates) in unhashed widget names.
+
+    Args:
+        widgets: Widgets to index
+
+    Returns:
+        Dictionary mapping widget identifier (and base name) to Widget
+    """
+    result = {}
+    hashed = []
+    for widget in widgets:
+        result[widget.identifier] = widget
+        base_name = _HASH_SUFFIX_RE.sub("", widget.identifier)
+        if base_name != widget.identifier:
+            hashed.append((base_name, widget))
+    for base_name, widget in hashed:
+        result.setdefault(base_name, widget)
+    return result
@@ -0,0 +1,64 @@
+"""Output buffering shared by the runnable test scripts."""
+import asyncio
+import io
+import sys
+from contextlib import contextmanager, redirect_stdout
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+
+@contextmanager
+def buffered_output():
+    """Collect print() output and write it to stdout in a single call.
+
+    The buffer is flushed even if the body raises, so partial output is
+    never lost.
+    """
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
+
+
+# Per-task print() buffer used while phases run concurrently
+_phase_out: ContextVar[Optional[io.StringIO]] = ContextVar("_phase_out", default=None)
+
+
+class _PhaseStdout(io.TextIOBase):
+    """stdout proxy that sends writes to the running phase's buffer, if any."""
+
+    def __init__(self, target):
+        self._target = target
+
+    def write(self, s):
+        return (_phase_out.get() or self._target).write(s)
+
+
+async def _run_phase(coro):
+    """Await a phase with its output captured.
+
+    Returns:
+        (captured output, exception or None)
+    """
+    buf = io.StringIO()
+    _phase_out.set(buf)  # gather runs each phase in its own context copy
+    try:
+        await coro
+        return buf.getvalue(), None
+    except Exception as e:
+        return buf.getvalue(), e
+
+
+async def gather_phases(*coros) -> List[Tuple[str, Optional[Exception]]]:
+    """Run coroutines concurrently, each printing into its own buffer.
+
+    Callers write the captured outputs in argument order, so a report
+    reads as if the phases had run one after another.
+
+    Returns:
+        (captured output, exception or None) per coroutine, in argument order
+    """
+    with redirect_stdout(_PhaseStdout(sys.stdout)):
+        return await asyncio.gather(*(_run_phase(coro) for coro in coros))
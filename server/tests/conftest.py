@@ -0,0 +1,46 @@
+"""Shared fixtures for server tests."""
+import pytest
+from pytest_asyncio import is_async_test
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run every async test on one session-wide event loop.
+
+    Session-scoped async fixtures (e.g. tools_by_name) live on that loop
+    too, and no test pays for creating and closing its own loop.
+
+    Tests marked ``integration`` are skipped unless ``--integration`` is given.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    skip_integration = None
+    if not config.getoption("--integration", default=False):
+        skip_integration = pytest.mark.skip(reason="need --integration to run")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        if skip_integration and "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+@pytest.fixture(scope="session")
+def mcp_server():
+    """Create MCP server instance once; tests only read from it."""
+    from server.config import CONFIG
+    from server.factory import create_mcp_server
+
+    return create_mcp_server(CONFIG)
+
+
+@pytest.fixture
+def offline_sports_clients(monkeypatch):
+    """Force every sport client onto its bundled mock data (no network).
+
+    Handlers obtain clients through SportsClientFactory, which hands out
+    per-sport singletons, so flipping use_mock on those instances keeps
+    handler tests offline regardless of USE_MOCK_SPORTS_DATA.
+    """
+    from server.services.sports import SportsClientFactory
+
+    for sport in SportsClientFactory.list_sports():
+        client = SportsClientFactory.create_client(sport)
+        monkeypatch.setattr(client, "use_mock", True)
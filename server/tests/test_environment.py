@@ -13,8 +13,28 @@ import sys
 import os
 from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add project root to path (once, if not already present)
+_PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from server.tests._output import buffered_output
+
+
+# 환경별 예상 설정: environment -> [(check name, predicate(config), description)]
+ENV_CHECKS = {
+    "development": (
+        ("Log Level", lambda c: c.log_level == "DEBUG", "Should be DEBUG"),
+        ("Mock Data", lambda c: c.use_mock_sports_data is True, "Should be True"),
+        ("Real API", lambda c: c.use_real_sports_api is False, "Should be False"),
+    ),
+    "production": (
+        ("Log Level", lambda c: c.log_level == "INFO", "Should be INFO"),
+        ("Mock Data", lambda c: c.use_mock_sports_data is False, "Should be False"),
+        ("API Key", lambda c: bool(c.sports_api_key and c.sports_api_key != "dummy_for_development"),
+         "Should have real API key"),
+    ),
+}
 
 
 def print_section(title: str):
@@ -31,65 +51,56 @@ def print_info(label: str, value: str):
 
 def test_environment():
     """환경 설정 테스트."""
-    # 환경 변수 출력
-    env = os.getenv('ENV', 'development')
-    print_section(f"Testing Environment: {env.upper()}")
-
-    # Config 로드
-    from server.config import CONFIG
-
-    # 기본 설정
-    print("\n📋 Basic Configuration:")
-    print_info("Environment", CONFIG.environment)
-    print_info("App Name", CONFIG.app_name)
-    print_info("Host:Port", f"{CONFIG.host}:{CONFIG.port}")
-    print_info("Log Level", CONFIG.log_level)
-
-    # Sports API 설정
-    print("\n🏀 Sports API Configuration:")
-    print_info("Base URL", CONFIG.sports_api_base_url)
-    print_info("API Key Set", "✓ Yes" if CONFIG.sports_api_key else "✗ No")
-    print_info("API Key (masked)",
-               CONFIG.sports_api_key[:10] + "..." if CONFIG.sports_api_key else "Not set")
-    print_info("Timeout", f"{CONFIG.sports_api_timeout_s}s")
-    print_info("Use Mock Data", str(CONFIG.use_mock_sports_data))
-    print_info("Has Sports API", "✓ Yes" if CONFIG.has_sports_api else "✗ No")
-    print_info("Use Real API", "✓ Yes" if CONFIG.use_real_sports_api else "✗ No")
-
-    # 환경별 예상 설정 검증
-    print("\n✅ Environment Validation:")
-
-    if CONFIG.environment == "development":
+    # 출력은 모아 두었다가 한 번에 기록 (실패해도 finally에서 기록)
+    with buffered_output():
+        # 환경 변수 출력
+        env = os.getenv('ENV', 'development')
+        print_section(f"Testing Environment: {env.upper()}")
+
+        # Config 로드
+        from server.config import CONFIG
+
+        # 기본 설정
+        print("\n📋 Basic Configuration:")
+        print_info("Environment", CONFIG.environment)
+        print_info("App Name", CONFIG.app_name)
+        print_info("Host:Port", f"{CONFIG.host}:{CONFIG.port}")
+        print_info("Log Level", CONFIG.log_level)
+
+        # Sports API 설정
+        print("\n🏀 Sports API Configuration:")
+        print_info("Base URL", CONFIG.sports_api_base_url)
+        print_info("API Key Set", "✓ Yes" if CONFIG.sports_api_key else "✗ No")
+        print_info("API Key (masked)",
+                   CONFIG.sports_api_key[:10] + "..." if CONFIG.sports_api_key else "Not set")
+        print_info("Timeout", f"{CONFIG.sports_api_timeout_s}s")
+        print_info("Use Mock Data", str(CONFIG.use_mock_sports_data))
+        print_info("Has Sports API", "✓ Yes" if CONFIG.has_sports_api else "✗ No")
+        print_info("Use Real API", "✓ Yes" if CONFIG.use_real_sports_api else "✗ No")
+
+        # 환경별 예상 설정 검증
+        print("\n✅ Environment Validation:")
+
+        if CONFIG.environment not in ENV_CHECKS:
+            print(f"⚠️  Unknown environment: {CONFIG.environment}")
         checks = [
-            ("Log Level", CONFIG.log_level == "DEBUG", "Should be DEBUG"),
-            ("Mock Data", CONFIG.use_mock_sports_data == True, "Should be True"),
-            ("Real API", CONFIG.use_real_sports_api == False, "Should be False"),
+            (check_name, check(CONFIG), description)
+            for check_name, check, description in ENV_CHECKS.get(CONFIG.environment, ())
         ]
-    elif CONFIG.environment == "production":
-        checks = [
-            ("Log Level", CONFIG.log_level == "INFO", "Should be INFO"),
-            ("Mock Data", CONFIG.use_mock_sports_data == False, "Should be False"),
-            ("API Key", bool(CONFIG.sports_api_key and CONFIG.sports_api_key != "dummy_for_development"),
-             "Should have real API key"),
-        ]
-    else:
-        checks = []
-        print(f"⚠️  Unknown environment: {CONFIG.environment}")
-
-    for check_name, result, description in checks:
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"  {status}: {check_name} - {description}")
-
-    # 전체 결과
-    all_passed = all(result for _, result, _ in checks)
-
-    print("\n" + "=" * 80)
-    if all_passed:
-        print(f"✅ All checks passed for {CONFIG.environment} environment!")
-        return 0
-    else:
-        print(f"❌ Some checks failed for {CONFIG.environment} environment!")
-        return 1
+
+        for check_name, result, description in checks:
+            status = "✅ PASS" if result else "❌ FAIL"
+            print(f"  {status}: {check_name} - {description}")
+
+        # 전체 결과
+        all_passed = all(result for _, result, _ in checks)
+
+        print("\n" + "=" * 80)
+        if all_passed:
+            print(f"✅ All checks passed for {CONFIG.environment} environment!")
+        else:
+            print(f"❌ Some checks failed for {CONFIG.environment} environment!")
+        return 0 if all_passed else 1
 
 
 if __name__ == "__main__":
@@ -6,43 +6,115 @@ Tests both widget-based tools and text-based tools.
 
 import asyncio
 import sys
+import traceback
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add project root to path (once, if not already present)
+_PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
-import mcp.types as types
-from server.config import CONFIG
-from server.services import build_widgets, build_tools
-from server.factory import create_mcp_server
-from server.handlers import get_games_by_sport_handler, get_game_details_handler
+from server.tests._output import buffered_output, gather_phases
 
+# Heavy imports (mcp, server.*) are deferred into the tests that use them
+# so collecting this module stays cheap. mcp_server comes from conftest.py.
 
-@pytest.fixture
-def mcp_server():
-    """Create MCP server instance for testing."""
-    return create_mcp_server(CONFIG)
+
+# Section separator for the printed report
+BAR = "=" * 60
+
+@pytest.fixture(autouse=True)
+def _buffer_test_output():
+    """Buffer each test's output and flush it once at teardown."""
+    with buffered_output():
+        yield
+
+
+def _unwrap(result):
+    """Return the payload of a ServerResult (or the result itself)."""
+    return getattr(result, 'root', result)
+
+
+@lru_cache(maxsize=64)
+def _widget_report(widget):
+    """Report block for one widget (Widget is frozen, so reports are cached)."""
+    return (
+        f"  • {widget.identifier}\n"
+        f"    Title: {widget.title}\n"
+        f"    Template URI: {widget.template_uri}\n"
+    )
+
+
+def bind_handlers(mcp_server):
+    """Resolve the protocol request handlers once.
+
+    Returns:
+        (list_tools, list_resources, call_tool, read_resource) handlers
+
+    Raises:
+        RuntimeError: If the server is missing one of them
+    """
+    import mcp.types as types
+
+    handlers = mcp_server._mcp_server.request_handlers
+    try:
+        return (
+            handlers[types.ListToolsRequest],
+            handlers[types.ListResourcesRequest],
+            handlers[types.CallToolRequest],
+            handlers[types.ReadResourceRequest],
+        )
+    except KeyError as e:
+        raise RuntimeError(f"MCP server has no handler for {e.args[0].__name__}") from e
+
+
+@pytest.fixture(scope="session")
+def bound_handlers(mcp_server):
+    """Protocol handlers of the shared server, resolved once."""
+    return bind_handlers(mcp_server)
+
+
+@pytest.fixture(scope="session")
+def list_tools_h(bound_handlers):
+    """list_tools request handler."""
+    return bound_handlers[0]
+
+
+@pytest.fixture(scope="session")
+def list_resources_h(bound_handlers):
+    """list_resources request handler."""
+    return bound_handlers[1]
+
+
+@pytest.fixture(scope="session")
+def call_tool_h(bound_handlers):
+    """call_tool request handler."""
+    return bound_handlers[2]
+
+
+@pytest.fixture(scope="session")
+def read_resource_h(bound_handlers):
+    """read_resource request handler."""
+    return bound_handlers[3]
 
 
 @pytest.mark.asyncio
 async def test_widget_loading():
     """Test that widgets are loaded correctly."""
-    print("=" * 60)
-    print("1. Testing Widget Loading")
-    print("=" * 60)
+    from server.config import CONFIG
+    from server.services import build_widgets
+
+    print(f"{BAR}\n1. Testing Widget Loading\n{BAR}")
 
     # Build widgets using factory function
     widgets = build_widgets(CONFIG)
 
     print(f"\n✓ Loaded {len(widgets)} widget(s):\n")
 
-    for widget in widgets:
-        print(f"  • {widget.identifier}")
-        print(f"    Title: {widget.title}")
-        print(f"    Template URI: {widget.template_uri}")
-        print()
+    print("\n".join(_widget_report(widget) for widget in widgets))
 
     return widgets
 
@@ -50,9 +122,11 @@ async def test_widget_loading():
 @pytest.mark.asyncio
 async def test_tool_loading():
     """Test that tools are loaded correctly (both widget and text-based)."""
-    print("=" * 60)
-    print("2. Testing Tool Loading")
-    print("=" * 60)
+    from server.config import CONFIG
+    from server.handlers import get_games_by_sport_handler, get_game_details_handler
+    from server.services import build_tools
+
+    print(f"{BAR}\n2. Testing Tool Loading\n{BAR}")
 
     # Build tools using factory function
     tools = build_tools(
@@ -84,43 +158,25 @@ async def test_tool_loading():
 
 
 @pytest.mark.asyncio
-async def test_list_tools(mcp_server):
+async def test_list_tools(list_tools_h):
     """Test listing available tools."""
-    print("=" * 60)
-    print("3. Testing Tools List (MCP Protocol)")
-    print("=" * 60)
-
-    # Get the list_tools handler
-    handler = mcp_server._mcp_server.request_handlers.get(types.ListToolsRequest)
-    if handler is None:
-        # Try getting from registered handlers
-        tools_list = []
-        if hasattr(mcp_server._mcp_server, '_tool_manager'):
-            tools_list = await mcp_server._mcp_server._tool_manager.list_tools()
-        else:
-            # Fallback: call the list_tools directly from server
-            request = types.ListToolsRequest()
-            result = await mcp_server._mcp_server.request_handlers[types.ListToolsRequest](request)
-            if hasattr(result, 'root'):
-                tools_list = result.root.tools
-            else:
-                tools_list = result.tools
-    else:
-        request = types.ListToolsRequest()
-        result = await handler(request)
-        if hasattr(result, 'root'):
-            tools_list = result.root.tools
-        else:
-            tools_list = result.tools
+    import mcp.types as types
+
+    print(f"{BAR}\n3. Testing Tools List (MCP Protocol)\n{BAR}")
+
+    result = await list_tools_h(types.ListToolsRequest())
+    tools_list = _unwrap(result).tools
 
     print(f"\n✓ Found {len(tools_list)} tool(s) via MCP protocol:\n")
+    # Resolve the metadata attribute name once (MCP types are uniform)
+    meta_attr = "_meta" if tools_list and hasattr(tools_list[0], '_meta') else "meta"
     for tool in tools_list:
         print(f"  • {tool.name}")
         print(f"    Title: {tool.title}")
         print(f"    Description: {tool.description}")
 
         # Check metadata for tool type
-        meta = getattr(tool, '_meta', None) or getattr(tool, 'meta', None)
+        meta = getattr(tool, meta_attr, None)
         if meta:
             has_widget = meta.get("openai/resultCanProduceWidget", False)
             print(f"    Can Produce Widget: {'✓' if has_widget else '✗'}")
@@ -130,20 +186,15 @@ async def test_list_tools(mcp_server):
 
 
 @pytest.mark.asyncio
-async def test_list_resources(mcp_server):
+async def test_list_resources(list_resources_h):
     """Test listing available resources."""
-    print("=" * 60)
-    print("4. Testing Resources List")
-    print("=" * 60)
+    import mcp.types as types
 
-    request = types.ListResourcesRequest()
-    handler = mcp_server._mcp_server.request_handlers[types.ListResourcesRequest]
-    result = await handler(request)
+    print(f"{BAR}\n4. Testing Resources List\n{BAR}")
 
-    if hasattr(result, 'root'):
-        resources_list = result.root.resources
-    else:
-        resources_list = result.resources
+    result = await list_resources_h(types.ListResourcesRequest())
+
+    resources_list = _unwrap(result).resources
 
     print(f"\n✓ Found {len(resources_list)} resource(s):\n")
     for resource in resources_list:
@@ -158,11 +209,11 @@ async def test_list_resources(mcp_server):
 
 
 @pytest.mark.asyncio
-async def test_call_widget_tool(mcp_server):
+async def test_call_widget_tool(call_tool_h):
     """Test calling a widget tool (get_game_details)."""
-    print("=" * 60)
-    print("5. Testing Widget Tool Call (get_game_details)")
-    print("=" * 60)
+    import mcp.types as types
+
+    print(f"{BAR}\n5. Testing Widget Tool Call (get_game_details)\n{BAR}")
 
     # Create tool call request - uses mock data
     request = types.CallToolRequest(
@@ -173,14 +224,10 @@ async def test_call_widget_tool(mcp_server):
     )
 
     # Call the handler
-    handler = mcp_server._mcp_server.request_handlers[types.CallToolRequest]
-    result = await handler(request)
+    result = await call_tool_h(request)
 
     # ServerResult contains the actual result
-    if hasattr(result, 'root'):
-        tool_result = result.root
-    else:
-        tool_result = result
+    tool_result = _unwrap(result)
 
     # Check if it's an error (expected since we're using mock data)
     is_error = getattr(tool_result, 'isError', False)
@@ -190,20 +237,22 @@ async def test_call_widget_tool(mcp_server):
         print("\n✓ Widget tool executed successfully\n")
 
     print("Response Content:")
-    if hasattr(tool_result, 'content'):
-        for content in tool_result.content:
-            if hasattr(content, 'text'):
-                print(f"  {content.text}")
+    for content in getattr(tool_result, 'content', None) or ():
+        text = getattr(content, 'text', None)
+        if text is not None:
+            print(f"  {text}")
 
-    if hasattr(tool_result, 'structuredContent') and tool_result.structuredContent:
+    structured = getattr(tool_result, 'structuredContent', None)
+    if structured:
         print(f"\nStructured Content (props for React):")
         import json
-        preview = json.dumps(tool_result.structuredContent, indent=2)[:300]
+        preview = json.dumps(structured, indent=2)[:300]
         print(f"  {preview}...")
 
-    if hasattr(tool_result, '_meta') and tool_result._meta:
+    meta = getattr(tool_result, '_meta', None)
+    if meta:
         print(f"\nWidget Metadata:")
-        widget_meta = tool_result._meta.get("openai.com/widget", {})
+        widget_meta = meta.get("openai.com/widget", {})
         if widget_meta:
             resource = widget_meta.get("resource", {})
             print(f"  URI: {resource.get('uri')}")
@@ -216,11 +265,11 @@ async def test_call_widget_tool(mcp_server):
 
 
 @pytest.mark.asyncio
-async def test_call_text_tool(mcp_server):
+async def test_call_text_tool(call_tool_h):
     """Test calling a text-based tool (get_games_by_sport)."""
-    print("=" * 60)
-    print("6. Testing Text Tool Call (get_games_by_sport)")
-    print("=" * 60)
+    import mcp.types as types
+
+    print(f"{BAR}\n6. Testing Text Tool Call (get_games_by_sport)\n{BAR}")
 
     # Test with basketball
     request = types.CallToolRequest(
@@ -230,13 +279,9 @@ async def test_call_text_tool(mcp_server):
         )
     )
 
-    handler = mcp_server._mcp_server.request_handlers[types.CallToolRequest]
-    result = await handler(request)
+    result = await call_tool_h(request)
 
-    if hasattr(result, 'root'):
-        tool_result = result.root
-    else:
-        tool_result = result
+    tool_result = _unwrap(result)
 
     is_error = getattr(tool_result, 'isError', False)
     if is_error:
@@ -245,35 +290,29 @@ async def test_call_text_tool(mcp_server):
         print("\n✓ Text tool executed successfully\n")
 
     print("Response:")
-    if hasattr(tool_result, 'content'):
-        for content in tool_result.content:
-            if hasattr(content, 'text'):
-                # Print first 500 chars
-                text = content.text
-                if len(text) > 500:
-                    print(f"  {text[:500]}...")
-                else:
-                    print(f"  {text}")
+    for content in getattr(tool_result, 'content', None) or ():
+        text = getattr(content, 'text', None)
+        if text is not None:
+            # Print first 500 chars
+            if len(text) > 500:
+                print(f"  {text[:500]}...")
+            else:
+                print(f"  {text}")
 
     return result
 
 
 @pytest.mark.asyncio
-async def test_read_resource(mcp_server):
+async def test_read_resource(list_resources_h, read_resource_h):
     """Test reading a resource (game-result-viewer widget)."""
-    print("=" * 60)
-    print("7. Testing Resource Read (game-result-viewer)")
-    print("=" * 60)
+    import mcp.types as types
+
+    print(f"{BAR}\n7. Testing Resource Read (game-result-viewer)\n{BAR}")
 
     # First get the widget URI from resources list
-    list_request = types.ListResourcesRequest()
-    list_handler = mcp_server._mcp_server.request_handlers[types.ListResourcesRequest]
-    list_result = await list_handler(list_request)
+    list_result = await list_resources_h(types.ListResourcesRequest())
 
-    if hasattr(list_result, 'root'):
-        resources = list_result.root.resources
-    else:
-        resources = list_result.resources
+    resources = _unwrap(list_result).resources
 
     if not resources:
         print("\n⚠️ No resources available to read\n")
@@ -291,34 +330,36 @@ async def test_read_resource(mcp_server):
     )
 
     # Call the handler
-    handler = mcp_server._mcp_server.request_handlers[types.ReadResourceRequest]
-    result = await handler(request)
+    result = await read_resource_h(request)
 
     print("✓ Resource read successfully\n")
 
     # Extract and display result
-    if hasattr(result, 'root'):
-        read_result = result.root
-    else:
-        read_result = result
+    read_result = _unwrap(result)
 
-    if hasattr(read_result, 'contents'):
-        for content in read_result.contents:
-            print(f"URI: {content.uri}")
-            print(f"MIME Type: {content.mimeType}")
-            print(f"HTML Size: {len(content.text)} bytes")
-            print(f"\nHTML Preview (first 300 chars):")
-            print(content.text[:300] + "...")
+    for content in getattr(read_result, 'contents', None) or ():
+        print(f"URI: {content.uri}")
+        print(f"MIME Type: {content.mimeType}")
+        html_text = content.text
+        print(f"HTML Size: {len(html_text)} bytes")
+        print(f"\nHTML Preview (first 300 chars):")
+        print(html_text[:300], "...", sep="")
 
     return result
 
 
 async def main():
     """Run all tests."""
-    print("\n" + "=" * 60)
-    print("MCP Server Test Suite (Refactored Architecture)")
-    print("=" * 60)
-    print()
+    with buffered_output():
+        await _run_all()
+
+
+async def _run_all():
+    """Run each test phase in order."""
+    from server.config import CONFIG
+    from server.factory import create_mcp_server
+
+    print(f"\n{BAR}\nMCP Server Test Suite (Refactored Architecture)\n{BAR}\n")
 
     try:
         # Test widget loading
@@ -328,42 +369,43 @@ async def main():
         await test_tool_loading()
 
         # Create MCP server instance
-        print("=" * 60)
-        print("Creating MCP Server Instance")
-        print("=" * 60)
+        print(f"{BAR}\nCreating MCP Server Instance\n{BAR}")
         mcp_server = create_mcp_server(CONFIG)
         print("\n✓ MCP server instance created\n")
 
-        # Test tools list
-        await test_list_tools(mcp_server)
-
-        # Test resources list
-        await test_list_resources(mcp_server)
-
-        # Test widget tool call
-        await test_call_widget_tool(mcp_server)
-
-        # Test text tool call
-        await test_call_text_tool(mcp_server)
-
-        # Test resource read
-        await test_read_resource(mcp_server)
-
-        print("\n" + "=" * 60)
-        print("✓ All tests passed!")
-        print("=" * 60)
-        print("\nArchitecture Summary:")
-        print("  • Widgets: Pure UI components (no tool metadata)")
-        print("  • Tools: Can be widget-based OR text-based")
-        print("  • Clear separation of concerns")
-        print("  • Both tool types tested successfully")
-        print("=" * 60)
-        print()
+        # Protocol phases are independent reads against the same server:
+        # run them concurrently, then print their output in phase order.
+        list_tools_h, list_resources_h, call_tool_h, read_resource_h = bind_handlers(mcp_server)
+        phases = (
+            test_list_tools(list_tools_h),
+            test_list_resources(list_resources_h),
+            test_call_widget_tool(call_tool_h),
+            test_call_text_tool(call_tool_h),
+            test_read_resource(list_resources_h, read_resource_h),
+        )
+        results = await gather_phases(*phases)
+        for output, _ in results:
+            sys.stdout.write(output)
+        for _, error in results:
+            if error is not None:
+                raise error
+
+        print(f"""
+{BAR}
+✓ All tests passed!
+{BAR}
+
+Architecture Summary:
+  • Widgets: Pure UI components (no tool metadata)
+  • Tools: Can be widget-based OR text-based
+  • Clear separation of concerns
+  • Both tool types tested successfully
+{BAR}
+""")
 
     except Exception as e:
         print(f"\n✗ Test failed with error:")
         print(f"  {type(e).__name__}: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -1,98 +1,101 @@
 """Test get_game_details MCP tool call."""
 import asyncio
-import json
+import logging
 from pathlib import Path
 import sys
 
 import pytest
+import pytest_asyncio
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add project root to path (once, if not already present)
+_PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
+import mcp.types as types
 from server.config import Config
 from server.factory.server_factory import create_mcp_server
 
+logger = logging.getLogger(__name__)
+
+
+async def list_tools_by_name(mcp):
+    """List tools over the MCP protocol, keyed by tool name."""
+    handler = mcp._mcp_server.request_handlers[types.ListToolsRequest]
+    result = await handler(types.ListToolsRequest())
+    return {tool.name: tool for tool in result.root.tools}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def tools_by_name(mcp_server):
+    """Tool listing, fetched once per session."""
+    return await list_tools_by_name(mcp_server)
+
+
+async def call_tool(mcp, name, arguments):
+    """Call a tool over the MCP protocol and return the CallToolResult."""
+    handler = mcp._mcp_server.request_handlers[types.CallToolRequest]
+    request = types.CallToolRequest(
+        params=types.CallToolRequestParams(name=name, arguments=arguments)
+    )
+    return (await handler(request)).root
+
 
 @pytest.mark.asyncio
-async def test_get_game_details():
+@pytest.mark.usefixtures("offline_sports_clients")
+async def test_get_game_details(mcp_server, tools_by_name):
     """Test get_game_details tool via MCP."""
-    cfg = Config()
-    mcp = create_mcp_server(cfg)
-
-    print("\n" + "="*60)
-    print("Testing get_game_details MCP Tool")
-    print("="*60)
-
-    # List tools
-    print("\n[1] Listing tools...")
-    tools_list = await mcp.list_tools()
-    print(f"Total tools: {len(tools_list)}")
-
-    # Find get_game_details
-    game_details_tool = None
-    for tool in tools_list:
-        if tool.name == "get_game_details":
-            game_details_tool = tool
-            break
-
-    if not game_details_tool:
-        print("❌ get_game_details tool not found!")
-        return False
-
-    print(f"\n✅ Found get_game_details tool")
-    print(f"   Description: {game_details_tool.description[:100]}...")
-    print(f"   Input schema: {json.dumps(game_details_tool.inputSchema, indent=2)}")
-
-    # Call the tool
-    print("\n[2] Calling get_game_details with game_id='OT2025313104237'...")
-    try:
-        result = await mcp.call_tool(
-            name="get_game_details",
-            arguments={"game_id": "OT2025313104237"}
-        )
-
-        print(f"\n✅ Tool call successful!")
-        print(f"   Result type: {type(result)}")
-        print(f"   Number of content items: {len(result.content)}")
-
-        for i, content in enumerate(result.content):
-            print(f"\n   Content [{i}]:")
-            print(f"     Type: {content.type}")
-            if hasattr(content, 'text'):
-                print(f"     Text: {content.text[:200]}...")
-            if hasattr(content, 'resource'):
-                print(f"     Resource URI: {content.resource.uri}")
-                print(f"     Resource mimeType: {content.resource.mimeType}")
-                if hasattr(content.resource, 'structuredContent'):
-                    print(f"     Has structuredContent: Yes")
-                    if hasattr(content.resource.structuredContent, 'game_id'):
-                        print(f"       Game ID: {content.resource.structuredContent.game_id}")
-                    if hasattr(content.resource.structuredContent, 'game_info'):
-                        print(f"       Game info: {content.resource.structuredContent.game_info}")
-
-        return True
-
-    except Exception as e:
-        print(f"\n❌ Tool call failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    game_details_tool = tools_by_name.get("get_game_details")
+    assert game_details_tool is not None, "get_game_details tool missing"
+    assert "game_id" in game_details_tool.inputSchema["properties"]
 
+    result = await call_tool(
+        mcp_server,
+        "get_game_details",
+        {"game_id": "OT2025313104237", "sport": "basketball", "date": "20251118"},
+    )
+
+    assert not result.isError, result.content
+    assert result.content, "tool returned no content"
+    assert "OT2025313104237" in result.content[0].text
+    logger.debug("get_game_details returned %d content items", len(result.content))
 
-async def main():
-    """Run test."""
-    success = await test_get_game_details()
 
-    print("\n" + "="*60)
-    if success:
-        print("✅ Test PASSED")
-    else:
-        print("❌ Test FAILED")
-    print("="*60)
+# Independent tool calls exercised through the protocol handler
+TOOL_CASES = [
+    ("get_game_details", {"game_id": "OT2025313104237", "sport": "basketball", "date": "20251118"}),
+    ("get_games_by_sport", {"date": "20251118", "sport": "basketball"}),
+]
 
-    return 0 if success else 1
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("offline_sports_clients")
+@pytest.mark.parametrize("name,arguments", TOOL_CASES)
+async def test_tool_call(mcp_server, name, arguments):
+    """Each tool returns non-error content."""
+    result = await call_tool(mcp_server, name, arguments)
+    assert not result.isError, result.content
+    assert result.content
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("offline_sports_clients")
+async def test_all_tools_concurrently(mcp_server):
+    """Independent tool calls can be dispatched together."""
+    results = await asyncio.gather(
+        *(call_tool(mcp_server, name, arguments) for name, arguments in TOOL_CASES)
+    )
+    for (name, _), result in zip(TOOL_CASES, results):
+        assert not result.isError, f"{name}: {result.content}"
+        assert result.content, f"{name} returned no content"
+
+
+async def main():
+    """Run test; any failure raises."""
+    mcp = create_mcp_server(Config())
+    await test_get_game_details(mcp, await list_tools_by_name(mcp))
+    print("✅ Test PASSED")
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
-    sys.exit(exit_code)
+    asyncio.run(main())
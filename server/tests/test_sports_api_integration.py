@@ -10,17 +10,35 @@ API_INTEGRATION.md 문서를 작성한 후 실행하세요.
     # 실제 API로 테스트
     USE_MOCK_SPORTS_DATA=false SPORTS_API_KEY=your_key python test_sports_api_integration.py
 """
+import asyncio
 import sys
 import json
 from pathlib import Path
 
 import pytest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Hits the Sports API when USE_MOCK_SPORTS_DATA=false; skipped unless --integration
+pytestmark = pytest.mark.integration
+
+# Add project root to path (once, if not already present)
+_PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from server.services.sports import SportsClientFactory
 from server.config import CONFIG
+from server.tests._output import buffered_output, gather_phases
+
+
+# NBA: 인디애나 vs 디트로이트 (실제 API)
+LIVE_GAME_ID = "OT2025313104280"
+# Mock 데이터에 통계가 들어있는 경기 (보스턴 vs 토론토)
+MOCK_GAME_ID = "OT2025313104237"
+
+
+def stats_game_id(client) -> str:
+    """클라이언트 모드(mock/real)에 맞는 통계 테스트용 경기 ID."""
+    return MOCK_GAME_ID if client.use_mock else LIVE_GAME_ID
 
 
 def print_section(title: str):
@@ -45,6 +63,12 @@ def print_info(message: str):
     print(f"ℹ️  {message}")
 
 
+@pytest.fixture
+def client():
+    """Basketball client shared by the API probes (factory singleton)."""
+    return SportsClientFactory.create_client("basketball")
+
+
 def test_configuration():
     """테스트 1: 설정 확인."""
     print_section("Test 1: Configuration Check")
@@ -56,129 +80,84 @@ def test_configuration():
 
     if CONFIG.use_real_sports_api:
         print_success("Real API mode enabled")
-        if not CONFIG.sports_api_key:
-            print_error("API Key is required for real API calls!")
-            return False
+        assert CONFIG.sports_api_key, "API Key is required for real API calls!"
     else:
         print_success("Mock data mode enabled")
 
-    return True
-
 
 @pytest.mark.asyncio
-async def test_games_by_sport():
+async def test_games_by_sport(client):
     """테스트 2: 경기 목록 조회."""
     print_section("Test 2: Get Games by Sport")
 
     test_date = "20251125"
     test_sport = "basketball"
-    client = SportsClientFactory.create_client(test_sport)
-
-    try:
-        print_info(f"Fetching games for {test_sport} on {test_date}...")
-        games = await client.get_games_by_sport(test_date)
 
-        print_success(f"Retrieved {len(games)} games")
+    print_info(f"Fetching games for {test_sport} on {test_date}...")
+    games = await client.get_games_by_sport(test_date)
 
-        if games:
-            # Show first game details
-            first_game = games[0]
-            print("\nFirst game details:")
-            print(json.dumps(first_game, indent=2, ensure_ascii=False))
+    print_success(f"Retrieved {len(games)} games")
 
-            # Validate required fields
-            required_fields = ["game_id", "home_team_name", "away_team_name", "state"]
-            missing_fields = [f for f in required_fields if f not in first_game]
+    if games:
+        # Show first game details
+        first_game = games[0]
+        print("\nFirst game details:")
+        print(json.dumps(first_game, indent=2, ensure_ascii=False))
 
-            if missing_fields:
-                print_error(f"Missing required fields: {missing_fields}")
-                print_error("You may need to update API_INTEGRATION.md field mappings")
-                return False
-            else:
-                print_success("All required fields present")
-
-        return True
-
-    except Exception as e:
-        print_error(f"Failed to fetch games: {e}")
-        print_info("Check your API_INTEGRATION.md configuration")
-        return False
+        # Validate required fields
+        required_fields = ["game_id", "home_team_name", "away_team_name", "state"]
+        missing_fields = [f for f in required_fields if f not in first_game]
+        assert not missing_fields, (
+            f"Missing required fields: {missing_fields} "
+            "(you may need to update API_INTEGRATION.md field mappings)"
+        )
+        print_success("All required fields present")
 
 
 @pytest.mark.asyncio
-async def test_team_stats():
+async def test_team_stats(client):
     """테스트 3: 팀 통계 조회."""
     print_section("Test 3: Get Team Stats")
 
-    test_game_id = "OT2025313104280"  # NBA: 인디애나 vs 디트로이트
-    client = SportsClientFactory.create_client('basketball')
-
-    try:
-        print_info(f"Fetching team stats for game {test_game_id}...")
-        stats = await client.get_team_stats(test_game_id)
+    test_game_id = stats_game_id(client)
 
-        if stats and len(stats) >= 2:
-            print_success(f"Retrieved team stats for 2 teams")
+    print_info(f"Fetching team stats for game {test_game_id}...")
+    stats = await client.get_team_stats(test_game_id)
 
-            print("\nHome team stats:")
-            print(json.dumps(stats[0], indent=2, ensure_ascii=False))
+    assert stats and len(stats) >= 2, "Expected 2 team stats (home and away)"
+    print_success(f"Retrieved team stats for 2 teams")
 
-            # Validate required fields
-            required_fields = ["home_team_id", "home_team_fgm_cn", "home_team_fga_cn"]
-            missing_fields = [f for f in required_fields if f not in stats[0]]
+    print("\nHome team stats:")
+    print(json.dumps(stats[0], indent=2, ensure_ascii=False))
 
-            if missing_fields:
-                print_error(f"Missing required fields: {missing_fields}")
-                return False
-            else:
-                print_success("All required fields present")
-
-            return True
-        else:
-            print_error("Expected 2 team stats (home and away)")
-            return False
-
-    except Exception as e:
-        print_error(f"Failed to fetch team stats: {e}")
-        return False
+    # Validate required fields
+    required_fields = ["home_team_id", "home_team_fgm_cn", "home_team_fga_cn"]
+    missing_fields = [f for f in required_fields if f not in stats[0]]
+    assert not missing_fields, f"Missing required fields: {missing_fields}"
+    print_success("All required fields present")
 
 
 @pytest.mark.asyncio
-async def test_player_stats():
+async def test_player_stats(client):
     """테스트 4: 선수 통계 조회."""
     print_section("Test 4: Get Player Stats")
 
-    test_game_id = "OT2025313104280"  # NBA: 인디애나 vs 디트로이트
-    client = SportsClientFactory.create_client('basketball')
-
-    try:
-        print_info(f"Fetching player stats for game {test_game_id}...")
-        stats = await client.get_player_stats(test_game_id)
+    test_game_id = stats_game_id(client)
 
-        if stats and len(stats) > 0:
-            print_success(f"Retrieved player stats for {len(stats)} players")
+    print_info(f"Fetching player stats for game {test_game_id}...")
+    stats = await client.get_player_stats(test_game_id)
 
-            print("\nFirst player stats:")
-            print(json.dumps(stats[0], indent=2, ensure_ascii=False))
+    assert stats, "No player stats returned"
+    print_success(f"Retrieved player stats for {len(stats)} players")
 
-            # Validate required fields
-            required_fields = ["player_name", "team_id", "tot_score", "treb_cn", "assist_cn"]
-            missing_fields = [f for f in required_fields if f not in stats[0]]
-
-            if missing_fields:
-                print_error(f"Missing required fields: {missing_fields}")
-                return False
-            else:
-                print_success("All required fields present")
-
-            return True
-        else:
-            print_error("No player stats returned")
-            return False
+    print("\nFirst player stats:")
+    print(json.dumps(stats[0], indent=2, ensure_ascii=False))
 
-    except Exception as e:
-        print_error(f"Failed to fetch player stats: {e}")
-        return False
+    # Validate required fields
+    required_fields = ["player_name", "team_id", "tot_score", "treb_cn", "assist_cn"]
+    missing_fields = [f for f in required_fields if f not in stats[0]]
+    assert not missing_fields, f"Missing required fields: {missing_fields}"
+    print_success("All required fields present")
 
 
 @pytest.mark.asyncio
@@ -187,39 +166,43 @@ async def test_error_handling():
     print_section("Test 5: Error Handling")
 
     # Test invalid date format
-    try:
-        print_info("Testing invalid date format...")
-        client = SportsClientFactory.create_client('basketball')
+    print_info("Testing invalid date format...")
+    client = SportsClientFactory.create_client('basketball')
+    with pytest.raises(Exception) as exc_info:
         await client.get_games_by_sport("invalid")
-        print_error("Should have raised ValueError for invalid date")
-        return False
-    except (ValueError, Exception) as e:
-        print_success(f"Correctly raised error: {e}")
+    print_success(f"Correctly raised error: {exc_info.value}")
 
     # Test invalid sport
-    try:
-        print_info("Testing invalid sport...")
-        client = SportsClientFactory.create_client("invalid")
-        print_error("Should have raised ValueError for invalid sport")
-        return False
-    except ValueError as e:
-        print_success(f"Correctly raised ValueError: {e}")
+    print_info("Testing invalid sport...")
+    with pytest.raises(ValueError) as exc_info:
+        SportsClientFactory.create_client("invalid")
+    print_success(f"Correctly raised ValueError: {exc_info.value}")
 
     # Test non-existent game
-    try:
-        print_info("Testing non-existent game...")
-        client = SportsClientFactory.create_client('basketball')
+    print_info("Testing non-existent game...")
+    with pytest.raises(Exception) as exc_info:
         await client.get_team_stats("NONEXISTENT")
-        print_error("Should have raised ValueError for non-existent game")
-        return False
-    except (ValueError, Exception) as e:
-        print_success(f"Correctly raised error: {e}")
+    print_success(f"Correctly raised error: {exc_info.value}")
 
-    return True
+
+async def _passed(name: str, coro) -> bool:
+    """Await a test coroutine; report and swallow its failure for the summary."""
+    try:
+        await coro
+        return True
+    except Exception as e:
+        print_error(f"{name}: {type(e).__name__}: {e}")
+        return False
 
 
 async def main():
-    """Run all tests."""
+    """Run all tests; the report is written to stdout in one call at the end."""
+    with buffered_output():
+        return await _run_all()
+
+
+async def _run_all():
+    """Run each test and print the summary."""
     print("\n" + "=" * 80)
     print(" Sports API Integration Test Suite")
     print("=" * 80)
@@ -227,11 +210,30 @@ async def main():
     results = []
 
     # Run tests
-    results.append(("Configuration", test_configuration()))
-    results.append(("Get Games by Sport", await test_games_by_sport()))
-    results.append(("Get Team Stats", await test_team_stats()))
-    results.append(("Get Player Stats", await test_player_stats()))
-    results.append(("Error Handling", await test_error_handling()))
+    try:
+        test_configuration()
+        results.append(("Configuration", True))
+    except AssertionError as e:
+        print_error(str(e))
+        results.append(("Configuration", False))
+
+    # Tests 2-4 are independent API round-trips; run them concurrently.
+    # Each probe prints into its own buffer, written out in probe order.
+    # One client (and HTTP connection pool) for every probe
+    client = SportsClientFactory.create_client("basketball")
+    probes = {
+        "Get Games by Sport": test_games_by_sport(client),
+        "Get Team Stats": test_team_stats(client),
+        "Get Player Stats": test_player_stats(client),
+    }
+    outcomes = await gather_phases(*probes.values())
+    for name, (output, error) in zip(probes, outcomes):
+        sys.stdout.write(output)
+        if error is not None:
+            print_error(f"{name}: {type(error).__name__}: {error}")
+        results.append((name, error is None))
+    results.append(("Error Handling", await _passed("Error Handling", test_error_handling())))
+    await client.aclose()
 
     # Print summary
     print_section("Test Summary")
@@ -265,5 +267,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
     sys.exit(asyncio.run(main()))
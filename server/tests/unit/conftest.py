@@ -0,0 +1,30 @@
+"""Shared fixtures for unit tests."""
+import pytest
+
+from server.services.sports import SportsClientFactory
+from server.services.sports.basketball.client import BasketballClient
+from server.services.sports.soccer.client import SoccerClient
+
+
+@pytest.fixture(scope="session")
+def basketball_client():
+    """Shared BasketballClient (tests only read from it)."""
+    return BasketballClient()
+
+
+@pytest.fixture(scope="session")
+def soccer_client():
+    """Shared SoccerClient (tests only read from it)."""
+    return SoccerClient()
+
+
+@pytest.fixture
+def sports_factory():
+    """SportsClientFactory whose registry and singletons are restored afterwards."""
+    registry = dict(SportsClientFactory._registry)
+    instances = dict(SportsClientFactory._instances)
+    yield SportsClientFactory
+    SportsClientFactory._registry.clear()
+    SportsClientFactory._registry.update(registry)
+    SportsClientFactory._instances.clear()
+    SportsClientFactory._instances.update(instances)
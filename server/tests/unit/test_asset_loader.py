@@ -0,0 +1,67 @@
+"""Tests for widget HTML loading and its stat-keyed cache."""
+import os
+
+import pytest
+
+from server.services.asset_loader import load_widget_html
+
+
+def _write(path, text, mtime_ns=None):
+    """Write text and optionally pin the file's mtime."""
+    path.write_text(text, encoding="utf8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestLoadWidgetHtml:
+    """load_widget_html caching and errors."""
+
+    def test_unchanged_file_is_served_from_cache(self, tmp_path):
+        """Same mtime and size: the cached content is returned without re-reading."""
+        html_path = tmp_path / "widget.html"
+        _write(html_path, "<p>one</p>")
+        mtime_ns = html_path.stat().st_mtime_ns
+
+        assert load_widget_html("widget", str(tmp_path)) == "<p>one</p>"
+
+        # Same length, same mtime: indistinguishable by stat(), so still cached
+        _write(html_path, "<p>two</p>", mtime_ns=mtime_ns)
+        assert load_widget_html("widget", str(tmp_path)) == "<p>one</p>"
+
+    def test_rewrite_with_new_mtime_is_reloaded(self, tmp_path):
+        """A newer mtime invalidates the cached content."""
+        html_path = tmp_path / "widget.html"
+        _write(html_path, "<p>one</p>", mtime_ns=1_000_000_000)
+        load_widget_html("widget", str(tmp_path))
+
+        _write(html_path, "<p>two</p>", mtime_ns=2_000_000_000)
+        assert load_widget_html("widget", str(tmp_path)) == "<p>two</p>"
+
+    def test_rewrite_within_same_mtime_tick_is_reloaded(self, tmp_path):
+        """A size change is detected even when a coarse mtime did not move."""
+        html_path = tmp_path / "widget.html"
+        _write(html_path, "<p>one</p>", mtime_ns=1_000_000_000)
+        load_widget_html("widget", str(tmp_path))
+
+        _write(html_path, "<p>longer</p>", mtime_ns=1_000_000_000)
+        assert load_widget_html("widget", str(tmp_path)) == "<p>longer</p>"
+
+    def test_missing_widget_html(self, tmp_path):
+        """Existing directory without the widget file names the file."""
+        with pytest.raises(FileNotFoundError, match="Widget HTML not found"):
+            load_widget_html("missing", str(tmp_path))
+
+    def test_missing_assets_dir(self, tmp_path):
+        """Missing assets directory is reported as such."""
+        with pytest.raises(FileNotFoundError, match="Assets directory not found"):
+            load_widget_html("widget", str(tmp_path / "nope"))
+
+    def test_deleted_file_is_not_served_from_cache(self, tmp_path):
+        """A file removed after loading raises instead of returning stale HTML."""
+        html_path = tmp_path / "widget.html"
+        _write(html_path, "<p>one</p>")
+        load_widget_html("widget", str(tmp_path))
+
+        html_path.unlink()
+        with pytest.raises(FileNotFoundError, match="Widget HTML not found"):
+            load_widget_html("widget", str(tmp_path))
@@ -1,33 +1,38 @@
 """Tests for client endpoint integration with mock injection."""
 import pytest
-from unittest.mock import patch, PropertyMock
 
 from server.services.sports.base.endpoints import SportEndpointConfig
-from server.services.sports.basketball.client import BasketballClient
-from server.services.sports.soccer.client import SoccerClient
 from server.services.sports import SportsClientFactory
+from server.services.sports.basketball.client import BasketballClient
+
+MOCK_ENDPOINT_CONFIG = SportEndpointConfig(
+    sport_name="test_basketball",
+    endpoints={
+        "games": "/test/games",
+        "team_stats": "/test/team-stats",
+        "player_stats": "/test/player-stats",
+    },
+    use_common=set()
+)
 
 
 class TestClientEndpointIntegration:
     """Test clients use endpoint configuration correctly."""
 
-    def test_basketball_client_has_endpoint_config(self):
+    def test_basketball_client_has_endpoint_config(self, basketball_client):
         """Basketball client exposes endpoint_config property."""
-        client = BasketballClient()
-        config = client.endpoint_config
+        config = basketball_client.endpoint_config
         assert config.sport_name == "basketball"
 
-    def test_client_get_endpoint_for_operation(self):
+    def test_client_get_endpoint_for_operation(self, basketball_client):
         """Client._get_endpoint_for_operation uses config."""
-        client = BasketballClient()
-        endpoint = client._get_endpoint_for_operation("team_stats")
+        endpoint = basketball_client._get_endpoint_for_operation("team_stats")
         assert "basketball" in endpoint.lower()
         assert "TeamStat" in endpoint
 
-    def test_client_list_available_operations(self):
+    def test_client_list_available_operations(self, basketball_client):
         """Client can list all available operations."""
-        client = BasketballClient()
-        ops = client.list_available_operations()
+        ops = basketball_client.list_available_operations()
         assert "games" in ops
         assert "team_stats" in ops
         assert "player_stats" in ops
@@ -38,33 +43,13 @@ class TestMockEndpointInjection:
 
     def test_inject_custom_endpoint_config(self):
         """Can inject custom endpoint config for testing."""
-        mock_config = SportEndpointConfig(
-            sport_name="test_basketball",
-            endpoints={
-                "games": "/test/games",
-                "team_stats": "/test/team-stats",
-                "player_stats": "/test/player-stats",
-            },
-            use_common=set()
-        )
-
-        client = BasketballClient()
-
-        with patch.object(
-            type(client), 'endpoint_config',
-            new_callable=PropertyMock,
-            return_value=mock_config
-        ):
-            endpoint = client._get_endpoint_for_operation("team_stats")
-            assert endpoint == "/test/team-stats"
-
-    def test_endpoint_isolation_between_clients(self):
-        """Modifying one client's endpoints doesn't affect others."""
-        basketball = BasketballClient()
-        soccer = SoccerClient()
+        client = BasketballClient(endpoint_config=MOCK_ENDPOINT_CONFIG)
+        assert client._get_endpoint_for_operation("team_stats") == "/test/team-stats"
 
-        bb_endpoint = basketball._get_endpoint_for_operation("team_stats")
-        sc_endpoint = soccer._get_endpoint_for_operation("team_stats")
+    def test_endpoint_isolation_between_clients(self, basketball_client, soccer_client):
+        """Modifying one client's endpoints doesn't affect others."""
+        bb_endpoint = basketball_client._get_endpoint_for_operation("team_stats")
+        sc_endpoint = soccer_client._get_endpoint_for_operation("team_stats")
 
         assert "basketball" in bb_endpoint.lower()
         assert "soccer" in sc_endpoint.lower()
@@ -94,19 +79,17 @@ class TestFactoryWithRegistry:
         assert "cricket" in str(exc_info.value)
         assert "basketball" in str(exc_info.value)
 
-    def test_register_new_sport(self):
+    def test_register_new_sport(self, sports_factory):
         """Can dynamically register new sport."""
         class MockCricketClient:
             def get_sport_name(self):
                 return "cricket"
 
-        SportsClientFactory.register("cricket", MockCricketClient)
+        sports_factory.register("cricket", MockCricketClient)
 
-        try:
-            assert "cricket" in SportsClientFactory.list_sports()
-            client = SportsClientFactory.create_client("cricket")
-            assert client.get_sport_name() == "cricket"
-        finally:
-            SportsClientFactory.unregister("cricket")
+        assert "cricket" in sports_factory.list_sports()
+        client = sports_factory.create_client("cricket")
+        assert client.get_sport_name() == "cricket"
 
-        assert "cricket" not in SportsClientFactory.list_sports()
+        sports_factory.unregister("cricket")
+        assert "cricket" not in sports_factory.list_sports()
@@ -0,0 +1,124 @@
+"""Tests for BaseSportsClient HTTP request handling."""
+import asyncio
+
+import httpx
+import pytest
+
+from server.services.sports.base import client as client_module
+from server.services.sports.basketball.client import BasketballClient
+
+
+@pytest.fixture
+def served(monkeypatch):
+    """Route the client's httpx.AsyncClient through a MockTransport.
+
+    Returns the list of requests the fake upstream received.
+    """
+    requests = []
+    real_async_client = httpx.AsyncClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"Data": {"list": []}}, headers={"ETag": '"v1"'})
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(
+        client_module.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_async_client(transport=transport, **kwargs),
+    )
+    return requests
+
+
+class TestConditionalRequests:
+    """ETag / If-None-Match revalidation."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_returns_cached_body(self, served):
+        """Second identical request sends If-None-Match and reuses the body on 304."""
+        client = BasketballClient()
+
+        first = await client._make_request("/games", {"date": "20251118"})
+        second = await client._make_request("/games", {"date": "20251118"})
+
+        await client.aclose()
+
+        assert "If-None-Match" not in served[0].headers
+        assert served[1].headers["If-None-Match"] == '"v1"'
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_etag_is_scoped_to_params(self, served):
+        """Different params do not reuse another request's ETag."""
+        client = BasketballClient()
+
+        await client._make_request("/games", {"date": "20251118"})
+        await client._make_request("/games", {"date": "20251119"})
+        await client.aclose()
+
+        assert "If-None-Match" not in served[1].headers
+
+
+class TestConnectionReuse:
+    """Pooled HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_requests_share_one_http_client(self, served):
+        """Consecutive requests go through the same pooled client."""
+        client = BasketballClient()
+
+        await client._make_request("/games", {"date": "20251118"})
+        http_client = client._http_client
+        await client._make_request("/games", {"date": "20251119"})
+
+        assert http_client is not None
+        assert client._http_client is http_client
+
+        await client.aclose()
+        assert http_client.is_closed
+
+    def test_new_event_loop_closes_previous_client(self, served):
+        """A request on a new loop replaces the pooled client and closes the old one."""
+        client = BasketballClient()
+
+        asyncio.run(client._make_request("/games", {"date": "20251118"}))
+        first_http_client = client._http_client
+        asyncio.run(client._make_request("/games", {"date": "20251118"}))
+
+        assert first_http_client.is_closed
+        assert client._http_client is not first_http_client
+        asyncio.run(client.aclose())
+
+    @pytest.mark.asyncio
+    async def test_app_shutdown_closes_factory_clients(self, sports_factory):
+        """Leaving the ASGI app lifespan closes every factory client's pool."""
+        from server.config import CONFIG
+        from server.factory import create_app
+
+        sports_factory._instances.clear()
+        client = sports_factory.create_client("basketball")
+        http_client = await client._get_http_client()
+
+        app = create_app(CONFIG)
+        async with app.router.lifespan_context(app):
+            assert not http_client.is_closed
+
+        assert http_client.is_closed
+
+
+class TestJsonParsing:
+    """Response body decoding."""
+
+    @pytest.mark.parametrize("charset", ["utf-8", "utf-16"])
+    def test_parses_declared_charset(self, charset):
+        """Bodies parse correctly whether or not orjson can read the charset."""
+        body = '{"name": "삼성"}'.encode(charset)
+        response = httpx.Response(
+            200,
+            content=body,
+            headers={"Content-Type": f"application/json; charset={charset}"},
+        )
+
+        assert client_module._parse_json(response) == {"name": "삼성"}
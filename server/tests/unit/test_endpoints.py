@@ -11,6 +11,25 @@ from server.services.sports.base.endpoints import (
 from server.services.sports.basketball.endpoints import BASKETBALL_ENDPOINTS
 from server.services.sports.soccer.endpoints import SOCCER_ENDPOINTS
 from server.services.sports.volleyball.endpoints import VOLLEYBALL_ENDPOINTS
+from server.services.sports.football.endpoints import FOOTBALL_ENDPOINTS
+
+# Sports sharing the games/team_stats/player_stats operation set:
+# (endpoint config, expected sport name)
+SPORTS = [
+    (BASKETBALL_ENDPOINTS, "basketball"),
+    (SOCCER_ENDPOINTS, "soccer"),
+    (VOLLEYBALL_ENDPOINTS, "volleyball"),
+    (FOOTBALL_ENDPOINTS, "football"),
+]
+SPORT_CONFIGS = [config for config, _ in SPORTS]
+REQUIRED_OPERATIONS = ("games", "team_stats", "player_stats")
+
+# Read-only configs shared by the tests below
+_CFG_CUSTOM_COMMON = SportEndpointConfig("test", {"custom": "/test/custom"}, {"games"})
+_CFG_TEAM_STATS = SportEndpointConfig("test", {"team_stats": "/test/team-stats"}, set())
+_CFG_TEAM_COMMON = SportEndpointConfig("test", {"team_stats": "/test/team"}, {"games"})
+_CFG_OVERRIDE = SportEndpointConfig("test", {"games": "/custom/games"}, {"games"})
+_CFG_EMPTY = SportEndpointConfig("empty", {}, set())
 
 
 class TestGetApiBasePath:
@@ -54,32 +73,17 @@ class TestSportEndpointConfig:
 
     def test_get_common_endpoint(self):
         """Can retrieve common endpoint via use_common."""
-        config = SportEndpointConfig(
-            sport_name="test",
-            endpoints={"custom": "/test/custom"},
-            use_common={"games"}
-        )
-        result = config.get_endpoint("games")
+        result = _CFG_CUSTOM_COMMON.get_endpoint("games")
         assert result == COMMON_ENDPOINTS.games
 
     def test_get_sport_specific_endpoint(self):
         """Can retrieve sport-specific endpoint."""
-        config = SportEndpointConfig(
-            sport_name="test",
-            endpoints={"team_stats": "/test/team-stats"},
-            use_common=set()
-        )
-        assert config.get_endpoint("team_stats") == "/test/team-stats"
+        assert _CFG_TEAM_STATS.get_endpoint("team_stats") == "/test/team-stats"
 
     def test_sport_specific_overrides_common(self):
         """Sport-specific endpoint takes priority over common."""
-        config = SportEndpointConfig(
-            sport_name="test",
-            endpoints={"games": "/custom/games"},
-            use_common={"games"}
-        )
         # Sport-specific is checked first
-        assert config.get_endpoint("games") == "/custom/games"
+        assert _CFG_OVERRIDE.get_endpoint("games") == "/custom/games"
 
     def test_unknown_operation_raises_error(self):
         """Unknown operation raises ValueError with helpful message."""
@@ -94,176 +98,110 @@ class TestSportEndpointConfig:
 
     def test_list_operations(self):
         """list_operations returns all available operations."""
-        config = SportEndpointConfig(
-            sport_name="test",
-            endpoints={"team_stats": "/test/team"},
-            use_common={"games"}
-        )
-        ops = config.list_operations()
+        ops = _CFG_TEAM_COMMON.list_operations()
         assert "team_stats" in ops
         assert "games" in ops
         assert "[common]" in ops["games"]
 
     def test_has_operation(self):
         """has_operation correctly checks availability."""
-        config = SportEndpointConfig(
-            sport_name="test",
-            endpoints={"team_stats": "/test/team"},
-            use_common={"games"}
-        )
-        assert config.has_operation("team_stats") is True
-        assert config.has_operation("games") is True
-        assert config.has_operation("unknown") is False
+        assert _CFG_TEAM_COMMON.has_operation("team_stats") is True
+        assert _CFG_TEAM_COMMON.has_operation("games") is True
+        assert _CFG_TEAM_COMMON.has_operation("unknown") is False
+
+    def test_endpoints_are_read_only(self):
+        """endpoints and use_common cannot be mutated after construction."""
+        with pytest.raises(TypeError):
+            _CFG_TEAM_COMMON.endpoints["new_op"] = "/new"
+        with pytest.raises(AttributeError):
+            _CFG_TEAM_COMMON.use_common.add("team_stats")
 
+    def test_source_dict_mutation_does_not_leak(self):
+        """Mutating the dict passed in leaves lookups consistent and unchanged."""
+        source = {"team_stats": "/test/team"}
+        config = SportEndpointConfig("test", source, {"games"})
+        assert config.has_operation("team_stats")
 
-class TestSportEndpointConfigEdgeCases:
-    """Edge case tests for SportEndpointConfig."""
+        source["player_stats"] = "/test/player"
+        del source["team_stats"]
 
-    def test_empty_endpoints_and_empty_use_common(self):
-        """Empty config raises error for any operation."""
-        config = SportEndpointConfig(
-            sport_name="empty",
-            endpoints={},
-            use_common=set()
-        )
-        with pytest.raises(ValueError, match="not supported"):
-            config.get_endpoint("games")
-        with pytest.raises(ValueError, match="not supported"):
-            config.get_endpoint("team_stats")
-        # has_operation returns False, not error
-        assert config.has_operation("games") is False
+        assert config.get_endpoint("team_stats") == "/test/team"
+        assert config.has_operation("team_stats") is True
+        assert config.has_operation("player_stats") is False
+        with pytest.raises(ValueError):
+            config.get_endpoint("player_stats")
+
+
+LONG_PATH = "/api/v1/" + "a" * 500 + "/endpoint"
+
+# (endpoints, use_common, operation, expected endpoint)
+EDGE_RESOLVES = [
+    pytest.param({"bad_endpoint": None}, set(), "bad_endpoint", None, id="none-returned-as-is"),
+    pytest.param({"Team_Stats": "/path/upper"}, set(), "Team_Stats", "/path/upper", id="case-exact"),
+    pytest.param({"team-stats": "/path/with-dash"}, set(), "team-stats", "/path/with-dash", id="dash"),
+    pytest.param({"stats.v2": "/path/with.dot"}, set(), "stats.v2", "/path/with.dot", id="dot"),
+    pytest.param({"games": "/custom/games/path"}, {"games"}, "games", "/custom/games/path",
+                 id="endpoints-override-common"),
+    pytest.param({"long_op": LONG_PATH}, set(), "long_op", LONG_PATH, id="very-long-path"),
+]
+
+# (endpoints, use_common, operation) that must raise "not supported"
+EDGE_RAISES = [
+    pytest.param({}, set(), "games", id="empty-config-games"),
+    pytest.param({}, set(), "team_stats", id="empty-config-team-stats"),
+    pytest.param({}, {"nonexistent_operation"}, "nonexistent_operation", id="unknown-common-op"),
+    pytest.param({"valid": "/path"}, {"games"}, "", id="empty-string"),
+    pytest.param({"valid": "/path"}, {"games"}, "   ", id="whitespace"),
+    pytest.param({"Team_Stats": "/path/upper"}, set(), "team_stats", id="case-lower"),
+    pytest.param({"Team_Stats": "/path/upper"}, set(), "TEAM_STATS", id="case-upper"),
+]
 
-    def test_use_common_with_nonexistent_common_endpoint(self):
-        """use_common references operation not in CommonEndpoints."""
-        config = SportEndpointConfig(
-            sport_name="test",
-            endpoints={},
-            use_common={"nonexistent_operation"}
-        )
-        with pytest.raises(ValueError, match="not supported"):
-            config.get_endpoint("nonexistent_operation")
 
-    def test_empty_string_operation(self):
-        """Empty string operation raises error."""
-        config = SportEndpointConfig(
-            sport_name="test",
-            endpoints={"valid": "/path"},
-            use_common={"games"}
-        )
-        with pytest.raises(ValueError, match="not supported"):
-            config.get_endpoint("")
+class TestSportEndpointConfigEdgeCases:
+    """Edge case tests for SportEndpointConfig."""
 
-    def test_none_in_endpoints_dict(self):
-        """None value in endpoints dict is returned as-is."""
-        config = SportEndpointConfig(
-            sport_name="test",
-            endpoints={"bad_endpoint": None},
-            use_common=set()
-        )
-        result = config.get_endpoint("bad_endpoint")
-        assert result is None
+    @pytest.mark.parametrize("endpoints,use_common,op,expected", EDGE_RESOLVES)
+    def test_get_endpoint_resolves(self, endpoints, use_common, op, expected):
+        """Defined operations resolve to their configured path."""
+        config = SportEndpointConfig("test", endpoints, use_common)
+        assert config.get_endpoint(op) == expected
 
-    def test_whitespace_operation_name(self):
-        """Whitespace-only operation name raises error."""
-        config = SportEndpointConfig(
-            sport_name="test",
-            endpoints={"valid": "/path"},
-            use_common={"games"}
-        )
+    @pytest.mark.parametrize("endpoints,use_common,op", EDGE_RAISES)
+    def test_get_endpoint_raises(self, endpoints, use_common, op):
+        """Undefined operations raise ValueError."""
+        config = SportEndpointConfig("test", endpoints, use_common)
         with pytest.raises(ValueError, match="not supported"):
-            config.get_endpoint("   ")
+            config.get_endpoint(op)
 
-    def test_case_sensitivity(self):
-        """Operation names are case-sensitive."""
-        config = SportEndpointConfig(
-            sport_name="test",
-            endpoints={"Team_Stats": "/path/upper"},
-            use_common=set()
-        )
-        assert config.get_endpoint("Team_Stats") == "/path/upper"
-        with pytest.raises(ValueError):
-            config.get_endpoint("team_stats")
-        with pytest.raises(ValueError):
-            config.get_endpoint("TEAM_STATS")
-
-    def test_special_characters_in_operation_name(self):
-        """Operation names with special characters work if defined."""
-        config = SportEndpointConfig(
-            sport_name="test",
-            endpoints={"team-stats": "/path/with-dash", "stats.v2": "/path/with.dot"},
-            use_common=set()
-        )
-        assert config.get_endpoint("team-stats") == "/path/with-dash"
-        assert config.get_endpoint("stats.v2") == "/path/with.dot"
-
-    def test_duplicate_in_endpoints_and_use_common_priority(self):
-        """When same operation in both, endpoints takes priority."""
-        config = SportEndpointConfig(
-            sport_name="test",
-            endpoints={"games": "/custom/games/path"},
-            use_common={"games"}
-        )
-        result = config.get_endpoint("games")
-        assert result == "/custom/games/path"
-        assert result != COMMON_ENDPOINTS.games
+    def test_has_operation_false_on_empty_config(self):
+        """has_operation returns False, not error."""
+        assert _CFG_EMPTY.has_operation("games") is False
 
     def test_list_operations_with_override(self):
         """list_operations shows overridden endpoint, not common."""
-        config = SportEndpointConfig(
-            sport_name="test",
-            endpoints={"games": "/custom/games"},
-            use_common={"games"}
-        )
-        ops = config.list_operations()
+        ops = _CFG_OVERRIDE.list_operations()
         assert ops["games"] == "/custom/games"
         assert "[common]" not in ops["games"]
 
     def test_error_message_shows_available_operations(self):
         """Error message lists available operations."""
-        config = SportEndpointConfig(
-            sport_name="test_sport",
-            endpoints={"op1": "/p1", "op2": "/p2"},
-            use_common={"games"}
-        )
+        config = SportEndpointConfig("test_sport", {"op1": "/p1", "op2": "/p2"}, {"games"})
         with pytest.raises(ValueError) as exc_info:
             config.get_endpoint("invalid")
         error_msg = str(exc_info.value)
         assert "test_sport" in error_msg
         assert "op1" in error_msg or "op2" in error_msg or "games" in error_msg
 
-    def test_very_long_endpoint_path(self):
-        """Very long endpoint paths are handled."""
-        long_path = "/api/v1/" + "a" * 500 + "/endpoint"
-        config = SportEndpointConfig(
-            sport_name="test",
-            endpoints={"long_op": long_path},
-            use_common=set()
-        )
-        assert config.get_endpoint("long_op") == long_path
-
     def test_unicode_in_sport_name(self):
         """Unicode characters in sport name work."""
-        config = SportEndpointConfig(
-            sport_name="축구",
-            endpoints={"team_stats": "/path"},
-            use_common=set()
-        )
+        config = SportEndpointConfig("축구", {"team_stats": "/path"}, set())
         assert config.sport_name == "축구"
         with pytest.raises(ValueError, match="축구"):
             config.get_endpoint("invalid")
 
 
 class TestBasketballEndpoints:
-    """Tests for basketball endpoint configuration."""
-
-    def test_sport_name(self):
-        """Sport name is basketball."""
-        assert BASKETBALL_ENDPOINTS.sport_name == "basketball"
-
-    def test_required_operations_exist(self):
-        """Required operations are defined."""
-        for op in ["games", "team_stats", "player_stats"]:
-            assert BASKETBALL_ENDPOINTS.has_operation(op)
+    """Basketball-specific endpoint checks."""
 
     def test_team_stats_endpoint_contains_basketball(self):
         """Team stats endpoint is basketball-specific."""
@@ -275,47 +213,21 @@ class TestBasketballEndpoints:
         assert "games" in BASKETBALL_ENDPOINTS.use_common
 
 
-class TestSoccerEndpoints:
-    """Tests for soccer endpoint configuration."""
-
-    def test_sport_name(self):
-        assert SOCCER_ENDPOINTS.sport_name == "soccer"
-
-    def test_required_operations_exist(self):
-        for op in ["games", "team_stats", "player_stats"]:
-            assert SOCCER_ENDPOINTS.has_operation(op)
-
-
-class TestVolleyballEndpoints:
-    """Tests for volleyball endpoint configuration."""
-
-    def test_sport_name(self):
-        assert VOLLEYBALL_ENDPOINTS.sport_name == "volleyball"
-
-    def test_required_operations_exist(self):
-        for op in ["games", "team_stats", "player_stats"]:
-            assert VOLLEYBALL_ENDPOINTS.has_operation(op)
-
-
 class TestAllSportsConsistency:
     """Cross-sport consistency tests."""
 
-    @pytest.mark.parametrize("config", [
-        BASKETBALL_ENDPOINTS,
-        SOCCER_ENDPOINTS,
-        VOLLEYBALL_ENDPOINTS,
-    ])
+    @pytest.mark.parametrize("config,name", SPORTS)
+    def test_sport_name(self, config, name):
+        """Each config carries its sport name."""
+        assert config.sport_name == name
+
+    @pytest.mark.parametrize("config", SPORT_CONFIGS)
     def test_all_have_required_operations(self, config):
         """All sports have the required operations."""
-        required = ["games", "team_stats", "player_stats"]
-        for op in required:
+        for op in REQUIRED_OPERATIONS:
             assert config.has_operation(op), f"{config.sport_name} missing {op}"
 
-    @pytest.mark.parametrize("config", [
-        BASKETBALL_ENDPOINTS,
-        SOCCER_ENDPOINTS,
-        VOLLEYBALL_ENDPOINTS,
-    ])
+    @pytest.mark.parametrize("config", SPORT_CONFIGS)
     def test_endpoints_start_with_slash(self, config):
         """All endpoint paths start with /."""
         for op in ["team_stats", "player_stats"]:
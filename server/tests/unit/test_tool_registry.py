@@ -0,0 +1,108 @@
+"""Tests for tool registry construction and caching."""
+import pytest
+
+from server.config import CONFIG
+from server.services.tool_registry import (
+    ToolRegistry,
+    build_tool_registry,
+    build_tools,
+    clear_tools_cache,
+)
+
+
+async def games_handler(arguments):
+    """Stand-in get_games_by_sport handler."""
+    return arguments
+
+
+async def details_handler(arguments):
+    """Stand-in get_game_details handler."""
+    return arguments
+
+
+async def other_games_handler(arguments):
+    """Second games handler, to check the handler is part of the cache key."""
+    return arguments
+
+
+@pytest.fixture
+def fresh_tools_cache():
+    """Start and end with an empty build_tools cache."""
+    clear_tools_cache()
+    yield
+    clear_tools_cache()
+
+
+@pytest.mark.usefixtures("fresh_tools_cache")
+class TestBuildToolsCache:
+    """build_tools memoization."""
+
+    def test_repeated_calls_return_same_tuple(self):
+        """Same config and handlers reuse the built tuple."""
+        first = build_tools(CONFIG, games_handler, details_handler)
+        second = build_tools(CONFIG, games_handler, details_handler)
+
+        assert second is first
+        assert [t.name for t in first] == ["get_games_by_sport", "get_game_details"]
+
+    def test_description_version_change_rebuilds(self):
+        """A different description_version yields a new tuple with that version."""
+        first = build_tools(CONFIG, games_handler, details_handler)
+        cfg = CONFIG.model_copy(update={"description_version": "test-v2"})
+
+        second = build_tools(cfg, games_handler, details_handler)
+
+        assert second is not first
+        assert all(t.description.startswith("[vtest-v2]") for t in second)
+
+    def test_handler_change_rebuilds(self):
+        """A different handler yields a new tuple using that handler."""
+        first = build_tools(CONFIG, games_handler, details_handler)
+
+        second = build_tools(CONFIG, other_games_handler, details_handler)
+
+        assert second is not first
+        assert second[0].handler is other_games_handler
+
+    def test_missing_handlers_drop_tools(self):
+        """Tools are only registered for the handlers that were given."""
+        assert build_tools(CONFIG) == ()
+        assert [t.name for t in build_tools(CONFIG, games_handler)] == ["get_games_by_sport"]
+
+    def test_clear_tools_cache_forces_rebuild(self):
+        """clear_tools_cache() drops the memoized tuple."""
+        first = build_tools(CONFIG, games_handler, details_handler)
+
+        clear_tools_cache()
+
+        assert build_tools(CONFIG, games_handler, details_handler) is not first
+
+
+class TestBuildToolRegistry:
+    """build_tool_registry and its lookup indexes."""
+
+    def test_returns_tools_and_indexes(self):
+        """Registry holds the built tools plus name and widget-URI lookups."""
+        registry = build_tool_registry(CONFIG, games_handler, details_handler)
+
+        assert isinstance(registry, ToolRegistry)
+        assert registry.tools == build_tools(CONFIG, games_handler, details_handler)
+        assert set(registry.tools_by_name) == {"get_games_by_sport", "get_game_details"}
+        for tool in registry.tools:
+            assert registry.tools_by_name[tool.name] is tool
+
+    def test_widgets_by_uri_only_has_widget_tools(self):
+        """Only widget tools contribute to widgets_by_uri."""
+        registry = build_tool_registry(CONFIG, games_handler, details_handler)
+        details = registry.tools_by_name["get_game_details"]
+
+        assert registry.widgets_by_uri == {details.widget.template_uri: details.widget}
+        assert not registry.tools_by_name["get_games_by_sport"].has_widget
+
+    def test_text_only_registry_has_no_widgets(self):
+        """Without the details handler there is no widget to serve."""
+        tools, tools_by_name, widgets_by_uri = build_tool_registry(CONFIG, games_handler)
+
+        assert [t.name for t in tools] == ["get_games_by_sport"]
+        assert list(tools_by_name) == ["get_games_by_sport"]
+        assert widgets_by_uri == {}
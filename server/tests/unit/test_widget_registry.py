@@ -0,0 +1,87 @@
+"""Tests for widget registry construction and indexing."""
+from server.config import CONFIG
+from server.models import Widget
+from server.services.widget_registry import build_widgets, clear_widgets_cache, index_widgets
+
+
+def _widget(identifier):
+    """Widget with the given identifier."""
+    return Widget(
+        identifier=identifier,
+        title=identifier,
+        template_uri=f"ui://widget/{identifier}.html",
+    )
+
+
+class TestBuildWidgetsCache:
+    """build_widgets memoization."""
+
+    def test_repeated_calls_share_widgets(self):
+        """Each call returns a fresh list over the same Widget objects."""
+        first = build_widgets(CONFIG)
+        second = build_widgets(CONFIG)
+
+        assert second is not first
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_clear_widgets_cache_forces_rebuild(self):
+        """clear_widgets_cache() rebuilds equal but new Widget objects."""
+        first = build_widgets(CONFIG)
+
+        clear_widgets_cache()
+        second = build_widgets(CONFIG)
+
+        assert second == first
+        assert second[0] is not first[0]
+
+
+class TestIndexWidgets:
+    """index_widgets keys by identifier and by hash-stripped base name."""
+
+    def test_unhashed_name_indexed_as_is(self):
+        """Plain identifiers are indexed only under themselves."""
+        widget = _widget("game-result-viewer")
+
+        assert index_widgets([widget]) == {"game-result-viewer": widget}
+
+    def test_hashed_name_also_indexed_by_base_name(self):
+        """A -<8+ hex> suffix is stripped to give an extra base-name key."""
+        widget = _widget("game-result-viewer-1a2b3c4d")
+
+        index = index_widgets([widget])
+
+        assert index["game-result-viewer-1a2b3c4d"] is widget
+        assert index["game-result-viewer"] is widget
+
+    def test_short_or_non_hex_suffix_is_not_stripped(self):
+        """Suffixes shorter than 8 chars or containing non-hex chars are kept."""
+        short = _widget("viewer-1a2b3c")
+        non_hex = _widget("viewer-1a2b3c4z")
+
+        assert set(index_widgets([short, non_hex])) == {"viewer-1a2b3c", "viewer-1a2b3c4z"}
+
+    def test_exact_identifier_wins_over_stripped_name(self):
+        """An exact identifier keeps its key even if listed after a hashed variant."""
+        hashed = _widget("example-deadbeef")
+        exact = _widget("example")
+
+        index = index_widgets([hashed, exact])
+
+        assert index["example"] is exact
+        assert index["example-deadbeef"] is hashed
+
+    def test_first_hashed_variant_wins_between_hashed_names(self):
+        """Two hashed builds of one widget: the first listed owns the base name."""
+        first = _widget("example-11111111")
+        second = _widget("example-22222222")
+
+        assert index_widgets([first, second])["example"] is first
+
+    def test_hex_looking_real_name_is_aliased(self):
+        """A real name ending in 8+ hex chars also answers to its stripped form."""
+        widget = _widget("scores-20251118")
+
+        index = index_widgets([widget])
+
+        assert index["scores-20251118"] is widget
+        assert index["scores"] is widget
@@ -1,4 +1,6 @@
 """캐시 모듈 단위 테스트."""
+import types
+
 import pytest
 from server.services.cache import (
     cache_games,
@@ -8,59 +10,80 @@ from server.services.cache import (
     invalidate_cache,
     get_cache_info,
     _is_valid_game,
+    _is_valid_game_generic,
     REQUIRED_GAME_FIELDS,
+    _cache_ctx,
+    _new_cache,
 )
 
 
-@pytest.fixture(autouse=True)
+# 여러 테스트가 쓰는 기본 게임 (읽기 전용; 캐시에 넣을 때는 dict()로 복사)
+_SAMPLE = types.MappingProxyType(
+    {"game_id": "G001", "home_team_name": "A", "away_team_name": "B"}
+)
+
+# _is_valid_game 입력과 기대 결과
+VALIDATION_CASES = [
+    pytest.param(
+        {"game_id": "G001", "home_team_name": "TeamA", "away_team_name": "TeamB"},
+        True, id="all-fields",
+    ),
+    pytest.param(
+        {"home_team_name": "TeamA", "away_team_name": "TeamB"},
+        False, id="missing-game-id",
+    ),
+    pytest.param(
+        {"game_id": "G001", "away_team_name": "TeamB"},
+        False, id="missing-home-team",
+    ),
+    pytest.param(
+        {"game_id": "G001", "home_team_name": "", "away_team_name": "TeamB"},
+        False, id="empty-field",
+    ),
+    pytest.param(
+        {"game_id": "G001", "home_team_name": "   ", "away_team_name": "TeamB"},
+        False, id="whitespace-field",
+    ),
+    pytest.param(
+        {"game_id": 1001, "home_team_name": "TeamA", "away_team_name": "TeamB"},
+        True, id="non-string-id",
+    ),
+]
+
+
+@pytest.fixture
 def clean_cache():
-    """각 테스트 전후로 캐시 정리."""
-    clear_cache()
+    """테스트마다 자기 컨텍스트에만 보이는 빈 캐시 사용 (캐시를 쓰는 테스트 클래스에만 적용).
+
+    공용 캐시는 건드리지 않으므로 정리(clear/invalidate)가 필요 없습니다.
+    """
+    token = _cache_ctx.set(_new_cache())
     yield
-    clear_cache()
+    _cache_ctx.reset(token)
 
 
 class TestGameValidation:
-    """게임 데이터 검증 테스트."""
+    """게임 데이터 검증 테스트 (캐시 미사용)."""
 
-    def test_valid_game_with_all_fields(self):
-        """모든 필수 필드가 있으면 유효."""
-        game = {
-            "game_id": "G001",
-            "home_team_name": "TeamA",
-            "away_team_name": "TeamB",
-        }
-        assert _is_valid_game(game) is True
-
-    def test_invalid_game_missing_game_id(self):
-        """game_id 누락 시 무효."""
-        game = {"home_team_name": "TeamA", "away_team_name": "TeamB"}
-        assert _is_valid_game(game) is False
-
-    def test_invalid_game_missing_home_team(self):
-        """home_team_name 누락 시 무효."""
-        game = {"game_id": "G001", "away_team_name": "TeamB"}
-        assert _is_valid_game(game) is False
-
-    def test_invalid_game_empty_field(self):
-        """필수 필드가 빈 문자열이면 무효."""
-        game = {
-            "game_id": "G001",
-            "home_team_name": "",
-            "away_team_name": "TeamB",
-        }
-        assert _is_valid_game(game) is False
+    @pytest.mark.parametrize("game,expected", VALIDATION_CASES)
+    def test_is_valid_game(self, game, expected):
+        """필수 필드가 모두 있고 비어있지 않아야 유효."""
+        assert _is_valid_game(game) is expected
 
-    def test_invalid_game_whitespace_field(self):
-        """필수 필드가 공백만 있으면 무효."""
-        game = {
-            "game_id": "G001",
-            "home_team_name": "   ",
-            "away_team_name": "TeamB",
-        }
-        assert _is_valid_game(game) is False
+    @pytest.mark.parametrize("game,expected", VALIDATION_CASES)
+    def test_generic_validator_agrees(self, game, expected):
+        """생성된 검증 함수와 필드 순회 버전의 결과가 같음."""
+        assert _is_valid_game_generic(game) is expected
+
+    def test_generated_validator_identifies_its_module(self):
+        """생성된 검증 함수도 모듈과 소스 위치를 갖고 있음 (traceback용)."""
+        assert _is_valid_game.__module__ == "server.services.cache"
+        assert _is_valid_game.__code__.co_filename == (
+            "<generated server.services.cache._is_valid_game>"
+        )
 
 
+@pytest.mark.usefixtures("clean_cache")
 class TestCacheGames:
     """cache_games 함수 테스트."""
 
@@ -109,7 +132,7 @@ class TestCacheGames:
 
     def test_cache_key_isolation(self):
         """다른 날짜/스포츠는 별도 키로 저장."""
-        games1 = [{"game_id": "G001", "home_team_name": "A", "away_team_name": "B"}]
+        games1 = [dict(_SAMPLE)]
         games2 = [{"game_id": "G002", "home_team_name": "C", "away_team_name": "D"}]
 
         cache_games("20241222", "basketball", games1)
@@ -119,12 +142,13 @@ class TestCacheGames:
         assert get_cached_games("20241223", "basketball")[0]["game_id"] == "G002"
 
 
+@pytest.mark.usefixtures("clean_cache")
 class TestInvalidateCache:
     """invalidate_cache 함수 테스트."""
 
     def test_invalidate_existing_cache(self):
         """존재하는 캐시 무효화."""
-        games = [{"game_id": "G001", "home_team_name": "A", "away_team_name": "B"}]
+        games = [dict(_SAMPLE)]
         cache_games("20241222", "basketball", games)
 
         result = invalidate_cache("20241222", "basketball")
@@ -139,7 +163,7 @@ class TestInvalidateCache:
 
     def test_invalidate_only_target_key(self):
         """특정 키만 무효화되고 다른 키는 유지."""
-        games1 = [{"game_id": "G001", "home_team_name": "A", "away_team_name": "B"}]
+        games1 = [dict(_SAMPLE)]
         games2 = [{"game_id": "G002", "home_team_name": "C", "away_team_name": "D"}]
         cache_games("20241222", "basketball", games1)
         cache_games("20241223", "basketball", games2)
@@ -150,6 +174,7 @@ class TestInvalidateCache:
         assert get_cached_games("20241223", "basketball") is not None
 
 
+@pytest.mark.usefixtures("clean_cache")
 class TestFindGameInCache:
     """find_game_in_cache 함수 테스트."""
 
@@ -167,24 +192,36 @@ class TestFindGameInCache:
 
     def test_find_nonexistent_game(self):
         """존재하지 않는 게임 찾기."""
-        games = [{"game_id": "G001", "home_team_name": "A", "away_team_name": "B"}]
+        games = [dict(_SAMPLE)]
         cache_games("20241222", "basketball", games)
 
         result = find_game_in_cache("20241222", "basketball", "NOTFOUND")
         assert result is None
 
+    def test_find_duplicate_game_id_returns_first(self):
+        """같은 game_id가 중복되면 첫 번째 게임 반환."""
+        games = [
+            {"game_id": "G001", "home_team_name": "First", "away_team_name": "B"},
+            {"game_id": "G001", "home_team_name": "Second", "away_team_name": "B"},
+        ]
+        cache_games("20241222", "basketball", games)
+
+        result = find_game_in_cache("20241222", "basketball", "G001")
+        assert result["home_team_name"] == "First"
+
     def test_find_in_empty_cache(self):
         """빈 캐시에서 찾기."""
         result = find_game_in_cache("20241222", "basketball", "G001")
         assert result is None
 
 
+@pytest.mark.usefixtures("clean_cache")
 class TestClearCache:
     """clear_cache 함수 테스트."""
 
     def test_clear_removes_all_entries(self):
         """캐시 정리 후 모든 항목 삭제됨."""
-        games = [{"game_id": "G001", "home_team_name": "A", "away_team_name": "B"}]
+        games = [dict(_SAMPLE)]
         cache_games("20241222", "basketball", games)
         cache_games("20241223", "soccer", games)
 
@@ -194,12 +231,13 @@ class TestClearCache:
         assert get_cached_games("20241223", "soccer") is None
 
 
+@pytest.mark.usefixtures("clean_cache")
 class TestCacheInfo:
     """get_cache_info 함수 테스트."""
 
     def test_cache_info_returns_stats(self):
         """캐시 상태 정보 반환."""
-        games = [{"game_id": "G001", "home_team_name": "A", "away_team_name": "B"}]
+        games = [dict(_SAMPLE)]
         cache_games("20241222", "basketball", games)
 
         info = get_cache_info()